@@ -1,39 +1,96 @@
-import uuid
-from contextlib import asynccontextmanager
+import asyncio
+import importlib
+import secrets
+import time
+from collections.abc import Callable
+from contextlib import asynccontextmanager, suppress
+from typing import Any
 
 from anyio import to_thread
 from core.settings import settings
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi_pagination import add_pagination as setup_pagination
 from shared.errors import setup_exception_handler
+from shared.types import StartupState
+from starlette.types import ASGIApp
 
+# How long a `/health` database check result is reused by subsequent probes
+_DB_CHECK_TTL_SECONDS = 1.0
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):  # noqa: ARG001
+
+async def _deferred_init(app: FastAPI) -> None:
     """
-    Lifespan context manager for FastAPI application.
+    Run startup actions that are not needed for the server to accept connections.
+
+    Marks the application as ready once every action has completed, or as failed when one of them raises.
     """
 
     from core.initializers.seeds import run_seeds
+    from core.logging import get_logger
+
+    try:
+        await run_seeds()
+    except Exception:
+        get_logger(__name__).exception("Deferred startup failed")
+        app.state.startup_state = StartupState.FAILED
+        return
+
+    app.state.startup_state = StartupState.READY
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Lifespan context manager for FastAPI application.
+
+    Startup actions run in a background task so the server binds its socket immediately, their
+    progress is reported through the `/health/live` and `/health/ready` probes.
+    """
 
     to_thread.current_default_thread_limiter().total_tokens = 60
 
     # Startup actions
-    await run_seeds()
+    app.state.startup_state = StartupState.STARTING
+    deferred_init = asyncio.create_task(_deferred_init(app))
 
     yield
 
+    deferred_init.cancel()
+
+    with suppress(asyncio.CancelledError):
+        await deferred_init
+
+
+def _lazy_middleware(path: str) -> Callable[..., ASGIApp]:
+    """
+    Returns a middleware factory that imports the middleware class from its dotted path only
+    when Starlette builds the middleware stack, on the first ASGI call including lifespan startup.
+
+    Args:
+        path: Dotted path to the middleware class, e.g. 'fastapi.middleware.gzip.GZipMiddleware'
+
+    Returns:
+        A callable accepted by `app.add_middleware` in place of the middleware class
+    """
+
+    module_name, _, class_name = path.rpartition(".")
+
+    def factory(app: ASGIApp, *args: Any, **kwargs: Any) -> ASGIApp:
+        middleware_class = getattr(importlib.import_module(module_name), class_name)
+        return middleware_class(app, *args, **kwargs)
+
+    return factory
+
 
 def setup_cors(app: FastAPI) -> None:
     """
     Configure CORS settings.
     """
 
-    from starlette.middleware.cors import CORSMiddleware
-
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=[str(origin).strip("/") for origin in settings.APP_CORS_ORIGINS],
+        _lazy_middleware("starlette.middleware.cors.CORSMiddleware"),
+        allow_origins=settings.APP_CORS_ORIGINS_NORMALIZED,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -53,22 +110,21 @@ def setup_openapi(app: FastAPI) -> None:
 def setup_middlewares(app: FastAPI) -> None:
     """
     Setup middlewares for the FastAPI application.
-    """
 
-    from asgi_correlation_id import CorrelationIdMiddleware
-    from core.logging.middleware import LoggingMiddleware
-    from core.middlewares.request_ip import RequestIPMiddleware
-    from fastapi.middleware.gzip import GZipMiddleware
+    The middleware modules are imported when the middleware stack is built on the first ASGI call,
+    which is lifespan startup under a server, so creating the application for one-off uses does not
+    pay for them.
+    """
 
-    app.add_middleware(GZipMiddleware, compresslevel=5, minimum_size=1000)
+    app.add_middleware(_lazy_middleware("fastapi.middleware.gzip.GZipMiddleware"), compresslevel=1, minimum_size=10240)
     app.add_middleware(
-        CorrelationIdMiddleware,
+        _lazy_middleware("asgi_correlation_id.CorrelationIdMiddleware"),
         header_name="X-Request-ID",
         update_request_header=True,
-        generator=lambda: uuid.uuid4().hex,
+        generator=lambda: secrets.token_hex(16),
     )
-    app.add_middleware(RequestIPMiddleware)
-    app.add_middleware(LoggingMiddleware)
+    app.add_middleware(_lazy_middleware("core.middlewares.request_ip.RequestIPMiddleware"))
+    app.add_middleware(_lazy_middleware("core.logging.middleware.LoggingMiddleware"))
 
 
 def setup_routes(app: FastAPI) -> None:
@@ -95,26 +151,50 @@ def setup_routes(app: FastAPI) -> None:
 def setup_root_path(app: FastAPI) -> None:
     """
     Setup root path redirection to docs.
+
+    The redirect response holds no per-request state, so it is built once and reused.
     """
 
     from fastapi.responses import RedirectResponse
 
+    docs_redirect = RedirectResponse(url="/docs", status_code=307)
+
     @app.get("/", include_in_schema=False)
     async def root():
-        return RedirectResponse(url="/docs")
+        return docs_redirect
 
 
 def setup_health_check(app: FastAPI) -> None:
     """
-    Add health check endpoint.
+    Add the health check endpoint.
+
+    `/health` checks the systems the application depends on, probes within `_DB_CHECK_TTL_SECONDS`
+    of each other share the same database check. The `/health/live` and `/health/ready` probes are
+    answered by `HealthCheckInterceptor`, which wraps the application in `main.app`.
     """
 
     from database.utils import check_db_connection
 
+    db_check: tuple[float, bool] = (float("-inf"), False)
+
+    async def cached_db_check() -> bool:
+        nonlocal db_check
+
+        checked_at, is_connected = db_check
+        now = time.monotonic()
+
+        if now - checked_at < _DB_CHECK_TTL_SECONDS:
+            return is_connected
+
+        is_connected = await check_db_connection()
+        db_check = (now, is_connected)
+
+        return is_connected
+
     @app.get("/health", include_in_schema=False)
     async def health_check():
         is_systems_operational = {
-            "database": await check_db_connection(),
+            "database": await cached_db_check(),
         }
 
         if not all(is_systems_operational.values()):
@@ -131,6 +211,8 @@ def create_app() -> FastAPI:
     """
     Creates and configures the FastAPI application.
 
+    Responses are rendered with orjson by default, route-specific responses such as redirects are unaffected.
+
     Returns:
         Configured FastAPI application instance
     """
@@ -142,6 +224,7 @@ def create_app() -> FastAPI:
         docs_url=None,
         redoc_url=None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     setup_exception_handler(app)
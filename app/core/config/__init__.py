@@ -1,4 +1,5 @@
 from .base import Settings as BaseSettings
+from .base import load_env
 from .local import Settings as LocalSettings
 from .production import Settings as ProductionSettings
 from .staging import Settings as StagingSettings
@@ -8,4 +9,5 @@ __all__ = [
     "LocalSettings",
     "StagingSettings",
     "ProductionSettings",
+    "load_env",
 ]
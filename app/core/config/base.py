@@ -1,3 +1,4 @@
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Annotated, Literal, Self
 
@@ -7,7 +8,14 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from shared.types import EnvironmentType
 from shared.utils import validate_bool, validate_list
 
-load_dotenv()
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """
+    Load the `.env` file into the process environment, at most once per process.
+    """
+
+    load_dotenv()
 
 
 class Settings(BaseSettings):
@@ -52,11 +60,19 @@ class Settings(BaseSettings):
     SENTRY_DSN: str | None = None
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
+    def APP_CORS_ORIGINS_NORMALIZED(self) -> tuple[str, ...]:
+        return tuple(str(origin).rstrip("/") for origin in self.APP_CORS_ORIGINS)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def APP_IS_LOCAL(self) -> bool:
+        return self.APP_ENVIRONMENT == EnvironmentType.LOCAL
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
     def APP_WORKERS_COUNT(self) -> int:
-        if self.APP_ENVIRONMENT == EnvironmentType.LOCAL:
-            return 1
-        return 4
+        return 1 if self.APP_IS_LOCAL else 4
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -66,7 +82,7 @@ class Settings(BaseSettings):
         if self.APP_DOMAIN.startswith("http") or self.APP_DOMAIN.startswith("https"):
             return self.APP_DOMAIN
 
-        if self.APP_ENVIRONMENT == EnvironmentType.LOCAL:
+        if self.APP_IS_LOCAL:
             return f"{scheme}://{self.APP_DOMAIN}:{self.APP_PORT}"
 
         return f"{scheme}://{self.APP_DOMAIN}"
@@ -77,12 +93,14 @@ class Settings(BaseSettings):
         return f"/api/{self.V1_STR}"
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def APP_SERVER_PORT(self) -> int:
-        if self.APP_ENVIRONMENT == EnvironmentType.LOCAL:
-            return int(self.APP_PORT)
+        server_ports = {
+            EnvironmentType.LOCAL: int(self.APP_PORT),
+            EnvironmentType.PRODUCTION: 443,
+        }
 
-        return 443 if self.APP_ENVIRONMENT == EnvironmentType.PRODUCTION else 80
+        return server_ports.get(self.APP_ENVIRONMENT, 80)
 
     POSTGRES_HOST: str = "localhost"
     POSTGRES_PORT: int | None = None
@@ -1,14 +1,100 @@
 import json
 from collections.abc import Callable
-from typing import Any, Literal
+from functools import lru_cache
+from typing import Any, Literal, Self
 
 from fastapi_filter.contrib.sqlalchemy.filter import Filter as _Filter
 from fastapi_filter.contrib.sqlalchemy.filter import _orm_operator_transformer
-from pydantic import Field, field_validator
-from sqlalchemy import String, cast, func, or_
+from pydantic import Field, PrivateAttr, field_validator, model_validator
+from sqlalchemy import String, cast, func
 from sqlalchemy.orm import Query
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.selectable import Select
 
+# (relationships, field, operator, transformer) parsed from a filter field name
+ParsedFieldName = tuple[tuple[str, ...], str, str, Callable[[Any], tuple[str, Any]] | None]
+
+_PARSED_FIELD_NAMES: dict[tuple[type, str], ParsedFieldName] = {}
+
+_ALLOWED_SORT_FIELDS: dict[type, frozenset[str]] = {}
+
+_SEARCH_DOCUMENTS: dict[type, ColumnElement[Any]] = {}
+
+# Keyed per model column and direction, the combinations of ordering values come from the request
+_ORDER_BY_CLAUSES: dict[tuple[type, str, bool], ColumnElement[Any]] = {}
+
+_JSONB_VALUE_FIELDS: dict[type, dict[str, str]] = {}
+
+# Filter operators whose raw query values are parsed before being passed to the query
+_JSONB_VALUE_OPERATORS = frozenset({"jsonb_contains", "jsonb_has_any_key", "jsonb_has_all_keys"})
+
+# PostgreSQL operators applied directly to a JSONB column
+_JSONB_OPERATORS: dict[str, str] = {
+    # @> containment operator - check if JSONB contains the given data
+    "op_jsonb_contains": "@>",
+    # ? operator - check if JSONB has a specific key
+    "op_jsonb_has_key": "?",
+    # ?| operator - check if JSONB has any of the specified keys
+    "op_jsonb_has_any_key": "?|",
+    # ?& operator - check if JSONB has all of the specified keys
+    "op_jsonb_has_all_keys": "?&",
+}
+
+# Comparisons applied to the text value extracted at a JSONB path
+_JSONB_PATH_OPERATORS: dict[str, Callable[[ColumnElement[Any], Any], ColumnElement[bool]]] = {
+    "op_jsonb_path_eq": lambda text_value, value: text_value == value,
+    "op_jsonb_path_ne": lambda text_value, value: text_value != value,
+    "op_jsonb_path_gt": lambda text_value, value: cast(text_value, String) > value,
+    "op_jsonb_path_gte": lambda text_value, value: cast(text_value, String) >= value,
+    "op_jsonb_path_lt": lambda text_value, value: cast(text_value, String) < value,
+    "op_jsonb_path_lte": lambda text_value, value: cast(text_value, String) <= value,
+    "op_jsonb_path_in": lambda text_value, values: text_value.in_(values),
+    "op_jsonb_path_like": lambda text_value, value: text_value.like(value),
+    "op_jsonb_path_ilike": lambda text_value, value: text_value.ilike(value),
+}
+
+
+@lru_cache(maxsize=512)
+def _parse_jsonb_path_value(value: str) -> tuple[str, str]:
+    """
+    Parse a JSONB path value string in the format 'key:value' or 'path.to.key:value'.
+
+    Clients tend to reuse the same paths, so parsed values are cached.
+
+    Args:
+        value: String in format 'key:value' or 'nested.key:value'
+
+    Returns:
+        Tuple of (path, value)
+
+    Examples:
+        'profession:engineer' -> ('profession', 'engineer')
+        'address.city:New York' -> ('address.city', 'New York')
+    """
+    if ":" not in value:
+        raise ValueError(f"JSONB path value must be in format 'key:value' or 'path.to.key:value', got: {value}")
+    path, val = value.split(":", 1)
+    return path.strip(), val.strip()
+
+
+@lru_cache(maxsize=512)
+def _parse_jsonb_path_list(value: str) -> tuple[str, tuple[str, ...]]:
+    """
+    Parse a JSONB path list value string in the format 'key:value1,value2,value3'.
+
+    Clients tend to reuse the same paths, so parsed values are cached.
+
+    Args:
+        value: String in format 'key:val1,val2' or 'nested.key:val1,val2'
+
+    Returns:
+        Tuple of (path, tuple of values)
+    """
+    if ":" not in value:
+        raise ValueError(f"JSONB path value must be in format 'key:value1,value2', got: {value}")
+    path, vals = value.split(":", 1)
+    return path.strip(), tuple(v.strip() for v in vals.split(","))
+
 
 class Filter(_Filter):
     """
@@ -17,65 +103,139 @@ class Filter(_Filter):
 
     search: str | None = Field(default=None, description="Perform a full text search on the model")
 
-    _ORM_OPERATORS: dict[str, Callable[[Any], tuple[str, Any]]] = {
-        "contains": lambda value: ("any", value),
+    # JSONB operator values parsed by `parse_jsonb_values`, keyed by field name
+    _jsonb_values: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    # Operators renamed without touching the value, the remaining ones use fastapi-filter's value transformers
+    _ORM_OPERATORS: dict[str, str] = {
+        "contains": "any",
         # JSONB operators for PostgreSQL
-        "jsonb_contains": lambda value: ("op_jsonb_contains", value),
-        "jsonb_has_key": lambda value: ("op_jsonb_has_key", value),
-        "jsonb_has_any_key": lambda value: ("op_jsonb_has_any_key", value),
-        "jsonb_has_all_keys": lambda value: ("op_jsonb_has_all_keys", value),
-        "jsonb_path_eq": lambda value: ("op_jsonb_path_eq", value),
-        "jsonb_path_ne": lambda value: ("op_jsonb_path_ne", value),
-        "jsonb_path_gt": lambda value: ("op_jsonb_path_gt", value),
-        "jsonb_path_gte": lambda value: ("op_jsonb_path_gte", value),
-        "jsonb_path_lt": lambda value: ("op_jsonb_path_lt", value),
-        "jsonb_path_lte": lambda value: ("op_jsonb_path_lte", value),
-        "jsonb_path_in": lambda value: ("op_jsonb_path_in", value),
-        "jsonb_path_like": lambda value: ("op_jsonb_path_like", value),
-        "jsonb_path_ilike": lambda value: ("op_jsonb_path_ilike", value),
-        **_orm_operator_transformer,
+        "jsonb_contains": "op_jsonb_contains",
+        "jsonb_has_key": "op_jsonb_has_key",
+        "jsonb_has_any_key": "op_jsonb_has_any_key",
+        "jsonb_has_all_keys": "op_jsonb_has_all_keys",
+        "jsonb_path_eq": "op_jsonb_path_eq",
+        "jsonb_path_ne": "op_jsonb_path_ne",
+        "jsonb_path_gt": "op_jsonb_path_gt",
+        "jsonb_path_gte": "op_jsonb_path_gte",
+        "jsonb_path_lt": "op_jsonb_path_lt",
+        "jsonb_path_lte": "op_jsonb_path_lte",
+        "jsonb_path_in": "op_jsonb_path_in",
+        "jsonb_path_like": "op_jsonb_path_like",
+        "jsonb_path_ilike": "op_jsonb_path_ilike",
     }
 
-    @staticmethod
-    def _parse_jsonb_path_value(value: str) -> tuple[str, str]:
+    class Constants(_Filter.Constants):
+        default_order_by: str
+        allowed_sort_fields: Literal["__all__"] | list[str] = []
+        original_filter: type["Filter"]  # type: ignore[misc, valid-type]
+
+    def _parse_field_name(self, field_name: str) -> ParsedFieldName:
         """
-        Parse a JSONB path value string in the format 'key:value' or 'path.to.key:value'.
+        Parse a filter field name into its relationship chain, model field, operator and operator transformer.
+
+        The result only depends on the filter class and the field name, so it is parsed once and cached.
 
         Args:
-            value: String in format 'key:value' or 'nested.key:value'
+            field_name: The filter field name, e.g. 'price__gte' or 'directory__categories__id__in'
 
         Returns:
-            Tuple of (path, value)
+            Tuple of (relationships, field, operator, transformer)
 
         Examples:
-            'profession:engineer' -> ('profession', 'engineer')
-            'address.city:New York' -> ('address.city', 'New York')
+            'title' -> ((), 'title', '__eq__', None)
+            'attributes__jsonb_has_key' -> ((), 'attributes', 'op_jsonb_has_key', None)
+            'price__gte' -> ((), 'price', 'gte', <transformer>)
+            'directory__categories__id__in' -> (('directory', 'categories'), 'id', 'in', <transformer>)
+        """
+        key = (type(self), field_name)
+        parsed = _PARSED_FIELD_NAMES.get(key)
+
+        if parsed is None:
+            if "__" in field_name:
+                # Pattern: relationship__...__field__operator, the last two parts are always field + operator
+                # and everything before that is a relationship chain to join through
+                *relationships, field, operator = field_name.split("__")
+                if operator in self._ORM_OPERATORS:
+                    parsed = (tuple(relationships), field, self._ORM_OPERATORS[operator], None)
+                else:
+                    parsed = (tuple(relationships), field, operator, _orm_operator_transformer[operator])
+            else:
+                parsed = ((), field_name, "__eq__", None)
+
+            _PARSED_FIELD_NAMES[key] = parsed
+
+        return parsed
+
+    def _get_search_document(self) -> ColumnElement[Any]:
+        """
+        Build the tsvector expression searched for models without a `search_vector` column.
+
+        It can be served by a functional GIN index on the same expression, e.g.
+        `CREATE INDEX ... USING GIN (to_tsvector('english', concat_ws(' ', field1, field2)))`.
+        The columns only depend on the filter class, so the expression is built once and cached.
+
+        Returns:
+            The `to_tsvector` expression over `Constants.search_model_fields`
         """
-        if ":" not in value:
-            raise ValueError(f"JSONB path value must be in format 'key:value' or 'path.to.key:value', got: {value}")
-        path, val = value.split(":", 1)
-        return path.strip(), val.strip()
+        search_document = _SEARCH_DOCUMENTS.get(type(self))
+
+        if search_document is None:
+            search_columns = [getattr(self.Constants.model, field) for field in self.Constants.search_model_fields]
+            search_document = func.to_tsvector("english", func.concat_ws(" ", *search_columns))
+            _SEARCH_DOCUMENTS[type(self)] = search_document
+
+        return search_document
 
-    @staticmethod
-    def _parse_jsonb_path_list(value: str) -> tuple[str, list[str]]:
+    def _apply_jsonb_filter(
+        self, query: Query[Any] | Select[Any], column: Any, operator: str, value: Any
+    ) -> Query[Any] | Select[Any]:
         """
-        Parse a JSONB path list value string in the format 'key:value1,value2,value3'.
+        Filter on a JSONB column using one of the `op_jsonb_*` operators.
 
         Args:
-            value: String in format 'key:val1,val2' or 'nested.key:val1,val2'
+            query: The query to filter
+            column: The JSONB model column, either on the filtered model or on a joined relationship
+            operator: The `op_jsonb_*` operator
+            value: The filter value, parsed by `parse_jsonb_values` where applicable
 
         Returns:
-            Tuple of (path, list of values)
+            The filtered query
         """
-        if ":" not in value:
-            raise ValueError(f"JSONB path value must be in format 'key:value1,value2', got: {value}")
-        path, vals = value.split(":", 1)
-        return path.strip(), [v.strip() for v in vals.split(",")]
+        if operator in _JSONB_PATH_OPERATORS:
+            return self._apply_jsonb_path_filter(query, column, operator, value)
 
-    class Constants(_Filter.Constants):
-        default_order_by: str
-        allowed_sort_fields: Literal["__all__"] | list[str] = []
-        original_filter: type["Filter"]  # type: ignore[misc, valid-type]
+        return query.filter(column.op(_JSONB_OPERATORS[operator])(value))
+
+    def _apply_jsonb_path_filter(
+        self, query: Query[Any] | Select[Any], column: Any, operator: str, value: str
+    ) -> Query[Any] | Select[Any]:
+        """
+        Filter on the text value found at a JSONB path using one of the `op_jsonb_path_*` operators.
+
+        Args:
+            query: The query to filter
+            column: The JSONB model column
+            operator: The `op_jsonb_path_*` operator
+            value: The raw filter value in the format 'path.to.key:value' (or 'path.to.key:val1,val2' for `in`)
+
+        Returns:
+            The filtered query
+        """
+        if operator == "op_jsonb_path_in":
+            path, comparison_value = _parse_jsonb_path_list(value)
+        else:
+            path, comparison_value = _parse_jsonb_path_value(value)
+
+        *parent_keys, final_key = path.split(".")
+        jsonb_expr = column
+
+        for part in parent_keys:
+            jsonb_expr = jsonb_expr.op("->")(part)
+
+        text_value = jsonb_expr.op("->>")(final_key)
+
+        return query.filter(_JSONB_PATH_OPERATORS[operator](text_value, comparison_value))
 
     def filter(self, query: Query[Any] | Select[Any]) -> Query[Any] | Select[Any]:
         for field_name, value in self.filtering_fields:
@@ -83,205 +243,141 @@ class Filter(_Filter):
             if isinstance(field_value, Filter):
                 query = field_value.filter(query)
             else:
-                if "__" in field_name:
-                    field_name, operator = field_name.split("__", 1)
-                    # Check if operator contains another __ (e.g., "id__in" from "categories__id__in")
-                    # This indicates a relationship filter pattern like: relationship__field__operator
-                    # or nested relationships: directory__categories__id__in
-                    if "__" in operator:
-                        # Parse the relationship chain
-                        # For directory__categories__id__in:
-                        #   - relationship_name = "directory"
-                        #   - remaining = "categories__id__in"
-                        relationship_name = field_name
-                        remaining = operator
-
-                        # Start with the first relationship
-                        current_model = self.Constants.model
+                value = self._jsonb_values.get(field_name, value)
+                relationships, field_name, operator, transformer = self._parse_field_name(field_name)
+
+                if transformer is not None:
+                    operator, value = transformer(value)
+
+                if relationships:
+                    # Join through each relationship in the chain
+                    # e.g., directory__categories__id__in -> join directory, then categories, then filter on id
+                    current_model = self.Constants.model
+                    for relationship_name in relationships:
                         relationship_attr = getattr(current_model, relationship_name)
                         query = query.join(relationship_attr)
                         current_model = relationship_attr.property.mapper.class_
 
-                        # Process remaining parts (could be nested relationships)
-                        parts = remaining.split("__")
-
-                        # Check if we have nested relationships
-                        # Pattern: field1__field2__...__operator
-                        # We need to determine where relationships end and field+operator begin
-                        # Strategy: work backwards - last two parts are field + operator
-                        # Everything before that is relationships
-
-                        if len(parts) >= 2:
-                            # Check if this is a nested relationship (more than 2 parts)
-                            # or just field__operator (2 parts)
-                            if len(parts) > 2:
-                                # Nested relationships: join through each one
-                                # e.g., categories__id__in -> join categories, then filter on id
-                                for i in range(len(parts) - 2):
-                                    next_rel_name = parts[i]
-                                    relationship_attr = getattr(current_model, next_rel_name)
-                                    query = query.join(relationship_attr)
-                                    current_model = relationship_attr.property.mapper.class_
-
-                                related_field = parts[-2]
-                                actual_operator = parts[-1]
-                            else:
-                                related_field = parts[0]
-                                actual_operator = parts[1]
-
-                            actual_operator, value = self._ORM_OPERATORS[actual_operator](value)
-
-                            related_model_field = getattr(current_model, related_field)
-
-                            if actual_operator == "op_jsonb_contains":
-                                if isinstance(value, str):
-                                    try:
-                                        value = json.loads(value)
-                                    except json.JSONDecodeError:
-                                        raise ValueError(f"Invalid JSON for jsonb_contains: {value}")
-                                query = query.filter(related_model_field.op("@>")(value))
-
-                            elif actual_operator == "op_jsonb_has_key":
-                                query = query.filter(related_model_field.op("?")(value))
-
-                            elif actual_operator == "op_jsonb_has_any_key":
-                                keys = value if isinstance(value, list) else value.split(",")
-                                query = query.filter(related_model_field.op("?|")(keys))
-
-                            elif actual_operator == "op_jsonb_has_all_keys":
-                                keys = value if isinstance(value, list) else value.split(",")
-                                query = query.filter(related_model_field.op("?&")(keys))
-
-                            elif actual_operator.startswith("op_jsonb_path_"):
-                                if actual_operator == "op_jsonb_path_in":
-                                    path, values = self._parse_jsonb_path_list(value)
-                                    json_value = None
-                                else:
-                                    path, json_value = self._parse_jsonb_path_value(value)
-                                    values = None
-
-                                path_parts = path.split(".")
-                                jsonb_expr = related_model_field
-
-                                for part in path_parts[:-1]:
-                                    jsonb_expr = jsonb_expr.op("->")(part)
-
-                                final_key = path_parts[-1]
-                                text_value = jsonb_expr.op("->>")(final_key)
-
-                                if actual_operator == "op_jsonb_path_eq":
-                                    query = query.filter(text_value == json_value)
-                                elif actual_operator == "op_jsonb_path_ne":
-                                    query = query.filter(text_value != json_value)
-                                elif actual_operator == "op_jsonb_path_gt":
-                                    query = query.filter(cast(text_value, String) > json_value)
-                                elif actual_operator == "op_jsonb_path_gte":
-                                    query = query.filter(cast(text_value, String) >= json_value)
-                                elif actual_operator == "op_jsonb_path_lt":
-                                    query = query.filter(cast(text_value, String) < json_value)
-                                elif actual_operator == "op_jsonb_path_lte":
-                                    query = query.filter(cast(text_value, String) <= json_value)
-                                elif actual_operator == "op_jsonb_path_in":
-                                    query = query.filter(text_value.in_(values))
-                                elif actual_operator == "op_jsonb_path_like":
-                                    query = query.filter(text_value.like(json_value))
-                                elif actual_operator == "op_jsonb_path_ilike":
-                                    query = query.filter(text_value.ilike(json_value))
-
-                            else:
-                                query = query.filter(getattr(related_model_field, actual_operator)(value))
-                        else:
-                            # Edge case: only one part after relationship, treat as field name
-                            related_field = parts[0]
-                            query = query.filter(getattr(current_model, related_field) == value)
-
-                        continue
-
-                    operator, value = self._ORM_OPERATORS[operator](value)
-                else:
-                    operator = "__eq__"
+                    model_field = getattr(current_model, field_name)
+
+                elif field_name == self.Constants.search_field_name:
+                    # plainto_tsquery ANDs the words and ignores tsquery syntax (&, |, !, :, quotes) in user input
+                    search_query = func.plainto_tsquery("english", value)
 
-                if field_name == self.Constants.search_field_name:
                     # Use full-text search with search_vector if available provided by `SearchableMixin`
                     if hasattr(self.Constants.model, "search_vector"):
-                        search_query = " & ".join(value.strip().split())
-                        query = query.filter(
-                            self.Constants.model.search_vector.op("@@")(func.to_tsquery("english", search_query))
-                        )
+                        query = query.filter(self.Constants.model.search_vector.op("@@")(search_query))
                     elif hasattr(self.Constants, "search_model_fields"):
-                        # Fallback to ilike search for models without search_vector
-                        search_filters = [
-                            getattr(self.Constants.model, field).ilike(f"%{value}%")
-                            for field in self.Constants.search_model_fields
-                        ]
-                        query = query.filter(or_(*search_filters))
+                        # Fallback to a tsvector built over the search fields for models without search_vector
+                        query = query.filter(self._get_search_document().op("@@")(search_query))
+
+                    continue
+
                 else:
                     model_field = getattr(self.Constants.model, field_name)
 
-                    if operator == "op_jsonb_contains":
-                        # @> containment operator - check if JSONB contains the given data
-                        if isinstance(value, str):
-                            try:
-                                value = json.loads(value)
-                            except json.JSONDecodeError:
-                                raise ValueError(f"Invalid JSON for jsonb_contains: {value}")
-                        query = query.filter(model_field.op("@>")(value))
-
-                    elif operator == "op_jsonb_has_key":
-                        # ? operator - check if JSONB has a specific key
-                        query = query.filter(model_field.op("?")(value))
-
-                    elif operator == "op_jsonb_has_any_key":
-                        # ?| operator - check if JSONB has any of the specified keys
-                        keys = value if isinstance(value, list) else value.split(",")
-                        query = query.filter(model_field.op("?|")(keys))
-
-                    elif operator == "op_jsonb_has_all_keys":
-                        # ?& operator - check if JSONB has all of the specified keys
-                        keys = value if isinstance(value, list) else value.split(",")
-                        query = query.filter(model_field.op("?&")(keys))
-
-                    elif operator.startswith("op_jsonb_path_"):
-                        if operator == "op_jsonb_path_in":
-                            path, values = self._parse_jsonb_path_list(value)
-                            json_value = None
-                        else:
-                            path, json_value = self._parse_jsonb_path_value(value)
-                            values = None
-
-                        path_parts = path.split(".")
-                        jsonb_expr = model_field
-
-                        for part in path_parts[:-1]:
-                            jsonb_expr = jsonb_expr.op("->")(part)
-
-                        final_key = path_parts[-1]
-                        text_value = jsonb_expr.op("->>")(final_key)
-
-                        if operator == "op_jsonb_path_eq":
-                            query = query.filter(text_value == json_value)
-                        elif operator == "op_jsonb_path_ne":
-                            query = query.filter(text_value != json_value)
-                        elif operator == "op_jsonb_path_gt":
-                            query = query.filter(cast(text_value, String) > json_value)
-                        elif operator == "op_jsonb_path_gte":
-                            query = query.filter(cast(text_value, String) >= json_value)
-                        elif operator == "op_jsonb_path_lt":
-                            query = query.filter(cast(text_value, String) < json_value)
-                        elif operator == "op_jsonb_path_lte":
-                            query = query.filter(cast(text_value, String) <= json_value)
-                        elif operator == "op_jsonb_path_in":
-                            query = query.filter(text_value.in_(values))
-                        elif operator == "op_jsonb_path_like":
-                            query = query.filter(text_value.like(json_value))
-                        elif operator == "op_jsonb_path_ilike":
-                            query = query.filter(text_value.ilike(json_value))
-
-                    else:
-                        query = query.filter(getattr(model_field, operator)(value))
+                if operator in _JSONB_OPERATORS or operator in _JSONB_PATH_OPERATORS:
+                    query = self._apply_jsonb_filter(query, model_field, operator, value)
+                else:
+                    query = query.filter(getattr(model_field, operator)(value))
 
         return query
 
+    def sort(self, query: Query[Any] | Select[Any]) -> Query[Any] | Select[Any]:
+        """
+        Order the query by the filter's `order_by` values.
+
+        The ORDER BY clause of each column and direction is built once and cached, the ordering values
+        themselves come from the request and are combined per call.
+
+        Args:
+            query: The query to order
+
+        Returns:
+            The ordered query
+        """
+        if not self.ordering_values:
+            return query
+
+        model = self.Constants.model
+        order_by_clauses = []
+
+        for field_name in self.ordering_values:
+            column_name = field_name.lstrip("+-")
+            descending = field_name.startswith("-")
+            order_by_clause = _ORDER_BY_CLAUSES.get((model, column_name, descending))
+
+            if order_by_clause is None:
+                column = getattr(model, column_name)
+                order_by_clause = column.desc() if descending else column.asc()
+                _ORDER_BY_CLAUSES[(model, column_name, descending)] = order_by_clause
+
+            order_by_clauses.append(order_by_clause)
+
+        return query.order_by(*order_by_clauses)
+
+    def apply(self, query: Query[Any] | Select[Any]) -> Query[Any] | Select[Any]:
+        """
+        Filter and order the query in a single call.
+
+        Args:
+            query: The query to filter and order
+
+        Returns:
+            The filtered and ordered query
+        """
+        return self.sort(self.filter(query))
+
+    @classmethod
+    def _get_jsonb_value_fields(cls) -> dict[str, str]:
+        """
+        Map the filter's fields whose values are parsed before use to their filter operator.
+
+        The fields only depend on the filter class, so they are collected once and cached.
+
+        Returns:
+            Dict of field name to operator, e.g. 'attributes__jsonb_contains' -> 'jsonb_contains'
+        """
+        jsonb_value_fields = _JSONB_VALUE_FIELDS.get(cls)
+
+        if jsonb_value_fields is None:
+            jsonb_value_fields = {
+                field_name: operator
+                for field_name in cls.model_fields
+                if (operator := field_name.rpartition("__")[2]) in _JSONB_VALUE_OPERATORS
+            }
+            _JSONB_VALUE_FIELDS[cls] = jsonb_value_fields
+
+        return jsonb_value_fields
+
+    @model_validator(mode="after")
+    def parse_jsonb_values(self) -> Self:
+        """
+        Parse raw query values for the JSONB operators once, when the filter is validated.
+
+        `__jsonb_contains` values are decoded from JSON and `__jsonb_has_any_key` / `__jsonb_has_all_keys`
+        values are split on commas. The field values are left as they are, so the fields can keep their
+        `str` annotations, and `filter()` reads the parsed values instead.
+
+        Raises:
+            ValueError: If a `__jsonb_contains` value is not valid JSON
+        """
+        for field_name, operator in self._get_jsonb_value_fields().items():
+            value = getattr(self, field_name)
+
+            if not isinstance(value, str):
+                continue
+
+            if operator == "jsonb_contains":
+                try:
+                    self._jsonb_values[field_name] = json.loads(value)
+                except json.JSONDecodeError:
+                    raise ValueError(f"Invalid JSON for jsonb_contains: {value}")
+            else:
+                self._jsonb_values[field_name] = value.split(",")
+
+        return self
+
     @field_validator("order_by", check_fields=False)
     def restrict_sortable_fields(cls, value: list[str] | None) -> list[str]:
         if value is None:
@@ -292,12 +388,16 @@ class Filter(_Filter):
         if isinstance(allowed_sort_fields, str) and allowed_sort_fields == "__all__":
             return value
 
+        allowed_sort_set = _ALLOWED_SORT_FIELDS.get(cls)
+        if allowed_sort_set is None:
+            allowed_sort_set = _ALLOWED_SORT_FIELDS[cls] = frozenset(allowed_sort_fields)
+
         for field_name in value:
-            field_name = field_name.replace("+", "").replace("-", "")  #
-            if field_name not in cls.Constants.allowed_sort_fields:
+            field_name = field_name.lstrip("+-")
+            if field_name not in allowed_sort_set:
                 raise ValueError(
                     f"`{field_name}` is not a valid ordering field. "
-                    f"You may only sort by: {', '.join(cls.Constants.allowed_sort_fields)}"
+                    f"You may only sort by: {', '.join(allowed_sort_fields)}"
                 )
 
         return value
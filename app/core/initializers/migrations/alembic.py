@@ -25,9 +25,9 @@ def _get_db_current_revision(sync_connection) -> Optional[str]:
     return mc.get_current_revision()
 
 
-def _get_head_revisions(cfg: Config) -> set:
+def _get_head_revisions(cfg: Config) -> frozenset[str]:
     script = ScriptDirectory.from_config(cfg)
-    return set(script.get_heads())
+    return frozenset(script.get_heads())
 
 
 def run_migrations() -> bool:
@@ -41,9 +41,7 @@ def run_migrations() -> bool:
 
     cfg = _get_alembic_config()
 
-    heads = _get_head_revisions(cfg)
-    logger.debug(f"Local alembic heads: {heads}")
-
+    # Migrations run once per process, so no connection is kept around afterwards
     sync_engine = create_engine(
         str(settings.SQLALCHEMY_DATABASE_URI),
         pool_pre_ping=True,
@@ -56,13 +54,19 @@ def run_migrations() -> bool:
         with sync_engine.connect() as conn:
             current = _get_db_current_revision(conn)
 
-        logger.debug(f"DB current revision: {current}")
+            logger.debug(f"DB current revision: {current}")
+
+            heads = _get_head_revisions(cfg)
+            logger.debug(f"Local alembic heads: {heads}")
 
-        if current is None or current not in heads:
-            logger.info(f"Database migrations are outdated (current={current}, heads={heads}). Upgrading...")
-            command.upgrade(cfg, "head")
-            logger.info("Database migrations upgraded to head")
-            return True
+            if current is None or current not in heads:
+                logger.info(f"Database migrations are outdated (current={current}, heads={heads}). Upgrading...")
+                # Share the connection with `migrations/env.py` instead of letting it open its own engine
+                cfg.attributes["connection"] = conn
+                command.upgrade(cfg, "head")
+                conn.commit()
+                logger.info("Database migrations upgraded to head")
+                return True
 
         logger.info(f"Database migrations already up-to-date (current={current}).")
         return False
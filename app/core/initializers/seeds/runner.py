@@ -1,15 +1,62 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
 from core.logging import get_logger
 from core.settings import settings
-from database.session import db_session_manager
+from database.session import db_session_manager, engine
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .property import run as property_seed
 
 logger = get_logger(__name__)
 
+# Seeders that don't depend on each other, each one runs in its own session so they can run concurrently
+_SEEDERS: tuple[tuple[str, Callable[[AsyncSession], Awaitable[Any]]], ...] = (
+    ("properties and geo-buckets", property_seed),
+)
+
+_MAX_CONCURRENT_SEEDERS = 5
+
+# Key of the advisory lock held while seeding, every worker runs the lifespan and only one of them may seed
+_SEED_LOCK_KEY = 4_180_233_517
+
+
+@asynccontextmanager
+async def _seed_lock() -> AsyncIterator[bool]:
+    """
+    Try to take the seeding advisory lock without waiting for it.
+
+    Yields:
+        Whether the lock was acquired, it is released on exit
+    """
+
+    async with engine.connect() as connection:
+        acquired = bool(await connection.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": _SEED_LOCK_KEY}))
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _SEED_LOCK_KEY})
+
+
+async def _run_seeder(
+    name: str,
+    seed: Callable[[AsyncSession], Awaitable[Any]],
+    semaphore: asyncio.Semaphore,
+) -> None:
+    async with semaphore, db_session_manager() as session:
+        logger.info(f"Seeding {name}...")
+        await seed(session)
+
 
 async def run_seeds() -> None:
     """
-    Run all seeds inside a DB session.
+    Run all seeds, each inside its own DB session.
+
+    Only the worker holding the seeding advisory lock runs them, the others skip seeding.
     """
 
     if not settings.APP_RUN_SEEDS:
@@ -17,10 +64,14 @@ async def run_seeds() -> None:
         return
 
     try:
-        logger.info("Starting seeding process...")
-        async with db_session_manager() as session:
-            logger.info("Seeding properties and geo-buckets...")
-            await property_seed(session)
+        async with _seed_lock() as acquired:
+            if not acquired:
+                logger.info("Seeding skipped, another worker is running the seeds")
+                return
+
+            logger.info("Starting seeding process...")
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SEEDERS)
+            await asyncio.gather(*(_run_seeder(name, seed, semaphore) for name, seed in _SEEDERS))
 
         logger.info("Seeding finished successfully")
     except Exception as e:
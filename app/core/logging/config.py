@@ -1,38 +1,49 @@
 import logging
 import sys
 
+import orjson
 import structlog
-from core.logging.processors import add_correlation, add_process_metadata, drop_healthcheck_logs
+from core.logging.processors import (
+    add_correlation,
+    add_process_metadata,
+    drop_healthcheck_logs,
+    maybe_dict_tracebacks,
+    rename_event,
+)
 from core.settings import settings
 from structlog.contextvars import merge_contextvars
 
 LOG_LEVEL_NAME = settings.APP_LOG_LEVEL
-LOG_LEVEL_VALUE = logging.getLevelNamesMapping().get(LOG_LEVEL_NAME, "INFO")
+LOG_LEVEL_VALUE = getattr(logging, LOG_LEVEL_NAME.upper(), logging.INFO)
 
 if not isinstance(LOG_LEVEL_VALUE, int):
     raise ValueError(f"Invalid LOG_LEVEL: {settings.APP_LOG_LEVEL}")
 
 
 def configure_logging() -> None:
+    # Third-party stdlib loggers still go through logging, structlog events are written as bytes directly
     logging.basicConfig(
         level=LOG_LEVEL_VALUE,
         format="%(message)s",
         stream=sys.stdout,
     )
 
+    # Ordering invariant: events below `LOG_LEVEL_VALUE` never enter the processor chain, the filtering
+    # bound logger turns those methods into no-ops. Of the remaining processors, the ones that may drop
+    # an event run before any enrichment so dropped events are not enriched.
     structlog.configure(
         wrapper_class=structlog.make_filtering_bound_logger(LOG_LEVEL_VALUE),  # type: ignore
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        logger_factory=structlog.BytesLoggerFactory(file=sys.stdout.buffer),
         cache_logger_on_first_use=True,
-        processors=[
-            add_correlation,
+        processors=(
             merge_contextvars,
             drop_healthcheck_logs,
+            add_correlation,
             structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S", utc=True),
             add_process_metadata,  # type: ignore
-            structlog.processors.dict_tracebacks,
-            structlog.processors.EventRenamer("msg"),
-            structlog.processors.JSONRenderer(),
-        ],
+            rename_event,
+            maybe_dict_tracebacks,
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
+        ),
     )
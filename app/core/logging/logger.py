@@ -1,5 +1,9 @@
+from functools import lru_cache
+
 import structlog
+from structlog.typing import FilteringBoundLogger
 
 
-def get_logger(name: str | None = None) -> structlog.BoundLogger:
+@lru_cache(maxsize=256)
+def get_logger(name: str | None = None) -> FilteringBoundLogger:
     return structlog.get_logger(name)
@@ -1,15 +1,19 @@
 import time
-from typing import Any
 
-from core.logging.context import bind_log_context, clear_log_context
 from starlette.types import ASGIApp, Message
+from structlog.contextvars import bind_contextvars, clear_contextvars
+
+_PROCESS_TIME_HEADER = b"X-Process-Time"
+
+# Probe endpoints are passed straight through, without logging context or timing
+_HEALTH_PATHS = frozenset({"/health", "/health/live", "/health/ready"})
 
 
 class LoggingMiddleware:
     """
     ASGI-style middleware that binds logging context for each request
 
-    It also adds an `X-Process-Time` header containing the request duration.
+    It also adds an `X-Process-Time` header containing the request duration in milliseconds.
     """
 
     def __init__(
@@ -19,36 +23,27 @@ class LoggingMiddleware:
         self.app = app
 
     async def __call__(self, scope, receive, send) -> None:
-        if scope["type"] != "http":
+        if scope["type"] != "http" or scope.get("path") in _HEALTH_PATHS:
             await self.app(scope, receive, send)
             return
 
-        start_time = time.time()
-
-        path = scope.get("path", None)
-        method = scope.get("method", None)
-
-        logging_context: dict[str, Any] = {}
-
-        if path is not None:
-            logging_context["path"] = path
-        if method is not None:
-            logging_context["method"] = method
+        start_time = time.perf_counter()
 
-        bind_log_context(
-            **logging_context,
-        )
+        # `path` and `method` are always present in an ASGI HTTP scope
+        bind_contextvars(path=scope["path"], method=scope["method"])
 
         async def send_wrapper(message: Message) -> None:
             if message.get("type") == "http.response.start":
-                duration = time.time() - start_time
-                headers = list(message.get("headers", []))
-                headers.append((b"X-Process-Time", str(duration).encode()))
-                message["headers"] = headers
+                duration = time.perf_counter() - start_time
+                # Copy rather than append in place, responses may share their header list between requests
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (_PROCESS_TIME_HEADER, f"{duration * 1000:.2f}".encode("ascii")),
+                ]
 
             await send(message)
 
         try:
             await self.app(scope, receive, send_wrapper)
         finally:
-            clear_log_context()
+            clear_contextvars()
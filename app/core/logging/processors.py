@@ -5,6 +5,18 @@ from typing import Any
 import structlog
 from asgi_correlation_id import correlation_id
 
+# Captured once instead of making two syscalls per log event, the pid is refreshed in forked workers
+_PID = os.getpid()
+_HOSTNAME = socket.gethostname()
+
+
+def _refresh_pid() -> None:
+    global _PID
+    _PID = os.getpid()
+
+
+os.register_at_fork(after_in_child=_refresh_pid)
+
 
 def add_correlation(_: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
 
@@ -20,8 +32,8 @@ def add_process_metadata(
     event_dict: dict[str, Any],
 ) -> dict[str, Any]:
 
-    event_dict["process_id"] = os.getpid()
-    event_dict["hostname"] = socket.gethostname()
+    event_dict["process_id"] = _PID
+    event_dict["hostname"] = _HOSTNAME
     return event_dict
 
 
@@ -36,8 +48,31 @@ def drop_healthcheck_logs(
     if path is None:
         return event_dict
 
-    is_healthcheck = path.endswith("/health")
+    is_healthcheck = path.endswith(("/health", "/health/live", "/health/ready"))
 
     if is_healthcheck:
         raise structlog.DropEvent
     return event_dict
+
+
+def rename_event(
+    _: Any,
+    __: str,
+    event_dict: dict[str, Any],
+) -> dict[str, Any]:
+
+    if (event := event_dict.pop("event", None)) is not None:
+        event_dict["msg"] = event
+    return event_dict
+
+
+def maybe_dict_tracebacks(
+    logger: Any,
+    method_name: str,
+    event_dict: dict[str, Any],
+) -> dict[str, Any]:
+
+    # Most events carry no exception, skip the renderer entirely for those
+    if "exc_info" not in event_dict:
+        return event_dict
+    return structlog.processors.dict_tracebacks(logger, method_name, event_dict)
@@ -0,0 +1,64 @@
+from fastapi import FastAPI
+from shared.types import StartupState
+from starlette.types import Receive, Scope, Send
+
+# (status, headers, body) of a prebuilt probe response
+_ProbeResponse = tuple[int, list[tuple[bytes, bytes]], bytes]
+
+
+def _json_response(status: int, body: bytes, *headers: tuple[bytes, bytes]) -> _ProbeResponse:
+    return (
+        status,
+        [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode()), *headers],
+        body,
+    )
+
+
+_ALIVE = _json_response(200, b'{"status":"alive"}')
+_READY = _json_response(200, b'{"status":"ready"}')
+_STARTING = _json_response(503, b'{"status":"starting"}')
+_FAILED = _json_response(503, b'{"status":"failed"}')
+_METHOD_NOT_ALLOWED = _json_response(405, b'{"detail":"Method Not Allowed"}', (b"allow", b"GET"))
+
+_READINESS_RESPONSES: dict[StartupState, _ProbeResponse] = {
+    StartupState.STARTING: _STARTING,
+    StartupState.READY: _READY,
+    StartupState.FAILED: _FAILED,
+}
+
+
+class HealthCheckInterceptor:
+    """
+    ASGI wrapper answering the liveness and readiness probes before the application is reached.
+
+    Probes fire constantly, so `/health/live` and `/health/ready` are served from prebuilt responses
+    without going through the middleware stack or routing. Every other request, including the
+    `/health` dependency check, is passed to the wrapped application.
+
+    - `/health/live` responds once the server is accepting connections, and with 503 once the deferred
+      startup actions have failed so the process gets restarted.
+    - `/health/ready` responds with 503 until the deferred startup actions have completed.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in ("/health/live", "/health/ready"):
+            await self.app(scope, receive, send)
+            return
+
+        # `startup_state` is set by the application lifespan, it is missing until the lifespan has started
+        startup_state = getattr(self.app.state, "startup_state", StartupState.STARTING)
+
+        if scope["method"] != "GET":
+            response = _METHOD_NOT_ALLOWED
+        elif scope["path"] == "/health/live":
+            response = _FAILED if startup_state is StartupState.FAILED else _ALIVE
+        else:
+            response = _READINESS_RESPONSES[startup_state]
+
+        status, headers, body = response
+
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
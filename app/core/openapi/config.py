@@ -5,7 +5,6 @@ from fastapi import FastAPI
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import HTMLResponse
-from shared.types import EnvironmentType
 
 from .middleware import OpenAPISecurityMiddleware
 
@@ -24,8 +23,8 @@ class OpenAPI:
         self.schema_url = f"{self.docs_url}{schema_path}"
 
     def setup(self, app: FastAPI) -> None:
-        if settings.APP_ENVIRONMENT in [EnvironmentType.STAGING, EnvironmentType.PRODUCTION]:
-            app.add_middleware(OpenAPISecurityMiddleware)
+        if not settings.APP_IS_LOCAL:
+            app.add_middleware(OpenAPISecurityMiddleware, paths=(self.docs_url, self.schema_url))
 
         @app.get(
             self.docs_url,
@@ -43,12 +42,16 @@ class OpenAPI:
             include_in_schema=False,
         )
         async def openapi() -> dict[str, Any]:
-            return get_openapi(
-                title=settings.APP_NAME,
-                description=settings.APP_DESCRIPTION,
-                version=settings.APP_VERSION,
-                routes=app.routes,
-            )
+            # The schema only depends on the registered routes, so build it on the first request and reuse it
+            if app.openapi_schema is None:
+                app.openapi_schema = get_openapi(
+                    title=settings.APP_NAME,
+                    description=settings.APP_DESCRIPTION,
+                    version=settings.APP_VERSION,
+                    routes=app.routes,
+                )
+
+            return app.openapi_schema
 
 
 openapi = OpenAPI()
@@ -1,8 +1,9 @@
 import base64
+import hmac
+from collections.abc import Iterable
 
 from core.logging import get_logger
 from core.settings import settings
-from fastapi import Request
 from shared.exceptions import InvalidAuthenticationFormatException, InvalidCredentialsException, InvalidSessionException
 from starlette.types import ASGIApp
 
@@ -20,20 +21,24 @@ class OpenAPISecurityMiddleware:
         *,
         username: str = settings.OPENAPI_USERNAME,
         password: str = settings.OPENAPI_PASSWORD,
+        paths: Iterable[str] = (settings.OPENAPI_DOCS_URL, settings.OPENAPI_JSON_SCHEMA_URL),
     ) -> None:
         self.app = app
 
         self.username = username
         self.password = password
+        self._username_bytes = username.encode()
+        self._password_bytes = password.encode()
+        self.paths = frozenset(paths)
 
     async def __call__(self, scope, receive, send) -> None:
         if scope.get("type") == "http":
-            request = Request(scope, receive=receive)
-            if request.url.path in [
-                settings.OPENAPI_DOCS_URL,
-                settings.OPENAPI_JSON_SCHEMA_URL,
-            ]:
-                auth_header = request.headers.get("Authorization")
+            # Only the protected paths need the headers, every other request is passed through untouched
+            if scope["path"] in self.paths:
+                auth_header = next(
+                    (value.decode("latin-1") for name, value in scope["headers"] if name == b"authorization"),
+                    None,
+                )
                 if not auth_header:
                     raise InvalidSessionException(headers={"WWW-Authenticate": 'Basic realm="OpenAPI Documentation"'})
 
@@ -44,10 +49,15 @@ class OpenAPISecurityMiddleware:
                             headers={"WWW-Authenticate": 'Basic realm="OpenAPI Documentation"'}
                         )
 
-                    decoded = base64.b64decode(auth_value).decode()
-                    username, password = decoded.split(":")
+                    decoded = base64.b64decode(auth_value, validate=True)
+                    # Passwords may contain ":", only the first one separates the username
+                    username, _, password = decoded.partition(b":")
 
-                    if username != self.username or password != self.password:
+                    # Constant-time comparisons, both are always evaluated
+                    is_valid_username = hmac.compare_digest(username, self._username_bytes)
+                    is_valid_password = hmac.compare_digest(password, self._password_bytes)
+
+                    if not (is_valid_username and is_valid_password):
                         raise InvalidCredentialsException(
                             headers={"WWW-Authenticate": 'Basic realm="OpenAPI Documentation"'}
                         )
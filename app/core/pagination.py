@@ -1,8 +1,12 @@
-from fastapi_pagination.bases import CursorRawParams
+from typing import Self
+
+from fastapi_pagination.bases import CursorRawParams, RawParams
 from fastapi_pagination.cursor import CursorParams as _CursorParams
 from fastapi_pagination.cursor import decode_cursor
 from fastapi_pagination.limit_offset import LimitOffsetParams as _LimitOffsetParams
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+_PAGINATION_MODEL_CONFIG = ConfigDict(frozen=True, validate_assignment=False, extra="forbid")
 
 
 class CursorParams(_CursorParams):
@@ -10,11 +14,30 @@ class CursorParams(_CursorParams):
     A custom `CursorParams` class that extends FastAPI Pagination's cursor pagination.
 
     It limits the page size to a default of 10 items per page and a maximum of 100 items per page.
-    Includes total count in the response.
+    The total count is only included when requested through `with_total`.
     """
 
+    model_config = _PAGINATION_MODEL_CONFIG
+
     size: int = Field(default=10, le=100, description="Number of items per page (max 100)")
 
+    _include_total: bool = PrivateAttr(default=False)
+
+    def with_total(self, include_total: bool) -> Self:
+        """
+        Returns a copy of these params that does or does not request the total count.
+
+        Args:
+            include_total (bool): Whether the paginator should run a count query
+
+        Returns:
+            Self: The copied params
+        """
+
+        params = self.model_copy()
+        params._include_total = include_total
+        return params
+
     def to_raw_params(self) -> CursorRawParams:
         return CursorRawParams(
             cursor=decode_cursor(
@@ -23,7 +46,7 @@ class CursorParams(_CursorParams):
                 quoted=self.quoted_cursor,
             ),
             size=self.size,
-            include_total=True,
+            include_total=self._include_total,
         )
 
 
@@ -39,6 +62,8 @@ class CursorPaginationMetadata(BaseModel):
         next_page (str | None): Cursor for the next page.
     """
 
+    model_config = _PAGINATION_MODEL_CONFIG
+
     total: int | None = Field(default=None, description="Total number of items available")
     current_page: str | None = Field(default=None, description="Cursor to refetch the current page")
     current_page_backwards: str | None = Field(
@@ -53,10 +78,37 @@ class LimitOffsetParams(_LimitOffsetParams):
     """
     A custom `LimitOffsetParams` that changes the default page size to 10 and
     enforces the same maximum of 100 items per page as the cursor params.
+    The total count is only included when requested through `with_total`.
     """
 
+    model_config = _PAGINATION_MODEL_CONFIG
+
     limit: int = Field(default=10, le=100, description="Number of items per page (max 100)")
 
+    _include_total: bool = PrivateAttr(default=False)
+
+    def with_total(self, include_total: bool) -> Self:
+        """
+        Returns a copy of these params that does or does not request the total count.
+
+        Args:
+            include_total (bool): Whether the paginator should run a count query
+
+        Returns:
+            Self: The copied params
+        """
+
+        params = self.model_copy()
+        params._include_total = include_total
+        return params
+
+    def to_raw_params(self) -> RawParams:
+        return RawParams(
+            limit=self.limit,
+            offset=self.offset,
+            include_total=self._include_total,
+        )
+
 
 class LimitOffsetPaginationMetadata(BaseModel):
     """
@@ -70,6 +122,8 @@ class LimitOffsetPaginationMetadata(BaseModel):
         next_offset (int | None): Offset for the next page, if any.
     """
 
+    model_config = _PAGINATION_MODEL_CONFIG
+
     total: int | None = Field(default=None, description="Total number of items available")
     limit: int = Field(description="Number of items requested per page")
     offset: int = Field(description="Current offset in the result set")
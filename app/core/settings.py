@@ -1,14 +1,17 @@
+import os
 from functools import lru_cache
 
-from core.config import BaseSettings, LocalSettings, ProductionSettings, StagingSettings
+from core.config import BaseSettings, LocalSettings, ProductionSettings, StagingSettings, load_env
 from shared.types import EnvironmentType
 
 
 @lru_cache(maxsize=1)
-def _get_settings() -> BaseSettings:
+def get_settings() -> BaseSettings:
     """
     Returns the appropriate settings based on the environment.
 
+    The settings are built once per process; subsequent calls return the cached instance.
+
     Returns:
         BaseSettings: The settings for the specified environment
 
@@ -16,7 +19,10 @@ def _get_settings() -> BaseSettings:
         ValueError: If an invalid environment is specified
     """
 
-    environment = EnvironmentType(BaseSettings().APP_ENVIRONMENT.lower())  # type: ignore
+    load_env()
+
+    # An empty `APP_ENVIRONMENT` falls back to local, like the other empty settings
+    environment_name = (os.getenv("APP_ENVIRONMENT") or EnvironmentType.LOCAL.value).lower()
 
     settings_map = {
         EnvironmentType.LOCAL: LocalSettings,
@@ -24,13 +30,13 @@ def _get_settings() -> BaseSettings:
         EnvironmentType.PRODUCTION: ProductionSettings,
     }
 
-    if environment not in settings_map:
+    if environment_name not in settings_map:
         raise ValueError(
-            f"Invalid environment: {environment.value}. "
+            f"Invalid environment: {environment_name}. "
             f"Must be one of {', '.join(env.value for env in EnvironmentType)}"
         )
 
-    return settings_map[environment]()  # type: ignore
+    return settings_map[EnvironmentType(environment_name)]()  # type: ignore
 
 
-settings = _get_settings()
+settings = get_settings()
@@ -43,6 +43,12 @@ def transactional(
                 -- Method code here --
     """
 
+    # Resolve the position of a `session` parameter once, at decoration time
+    try:
+        session_idx: int | None = list(inspect.signature(func).parameters).index("session")
+    except ValueError:
+        session_idx = None
+
     @functools.wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:  # type: ignore
         session = None
@@ -51,23 +57,18 @@ def transactional(
             session = args[0].session  # type: ignore
         elif "session" in kwargs:
             session = kwargs["session"]  # type: ignore
+        elif session_idx is None:
+            raise ValueError("Could not find session parameter in function or method")
+        elif len(args) > session_idx:
+            session = args[session_idx]  # type: ignore
         else:
-            sig = inspect.signature(func)
-            param_names = list(sig.parameters.keys())
-            try:
-                session_idx = param_names.index("session")
-                if len(args) > session_idx:
-                    session = args[session_idx]  # type: ignore
-                else:
-                    raise ValueError("Session argument is required but not provided")
-            except ValueError:
-                raise ValueError("Could not find session parameter in function or method")
+            raise ValueError("Session argument is required but not provided")
 
         if not isinstance(session, AsyncSession):
             raise TypeError("Session must be an instance of `AsyncSession` ")
 
-        # Execute the function either within the current transaction or in a new one.
-        if in_transaction():
+        # Execute the function either within the current transaction or in a new one
+        if in_transaction(session):
             return await func(*args, **kwargs)
 
         async with Transaction(session):
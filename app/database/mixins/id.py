@@ -1,20 +1,42 @@
-from uuid import UUID, uuid4
+from functools import cache
+from uuid import UUID
 
 import inflection
 from database.types.ulid import ULIDType
+from sqlalchemy import text
 from sqlalchemy.orm import declared_attr
 from sqlmodel import Field, SQLModel
 from ulid import ULID
 
 
+@cache
+def _table_name(class_name: str) -> str:
+    """
+    Derives the pluralized, snake_cased table name for a model class name.
+
+    Args:
+        class_name (str): The model class name
+
+    Returns:
+        str: The table name
+    """
+
+    return inflection.pluralize(inflection.underscore(class_name))
+
+
 class BaseIDMixin(SQLModel):
     """
     A base mixin for models with a primary key.
+
+    Server-generated values (defaults and `onupdate` expressions) are fetched eagerly through `RETURNING` on
+    INSERT and UPDATE, so models do not need a refresh after saving.
     """
 
+    __mapper_args__ = {"eager_defaults": True}
+
     @declared_attr  # type: ignore
     def __tablename__(cls) -> str:  # type: ignore
-        return inflection.pluralize(inflection.underscore(cls.__name__))
+        return _table_name(cls.__name__)
 
 
 class IntegerIDMixin(BaseIDMixin):
@@ -32,12 +54,15 @@ class UUIDMixin(BaseIDMixin):
     """
     A mixin for models with a UUID primary key.
 
+    The identifier is generated by Postgres (``gen_random_uuid()``) on insert, so it is
+    available after flush rather than at construction time.
+
     Attributes:
         id (str): The primary key field.
     """
 
     id: UUID = Field(
-        default_factory=uuid4,
+        sa_column_kwargs={"server_default": text("gen_random_uuid()")},
         primary_key=True,
         index=True,
         nullable=False,
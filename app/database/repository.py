@@ -1,9 +1,11 @@
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from functools import cache, lru_cache
 from typing import Any, Generic, Literal, TypeVar
 
 from core.filters import Filter
 from core.logging import get_logger
 from core.pagination import CursorParams, LimitOffsetParams
+from core.settings import settings
 from database.transaction import in_transaction
 from fastapi_pagination import set_page, set_params
 from fastapi_pagination.cursor import CursorPage
@@ -11,11 +13,14 @@ from fastapi_pagination.ext.sqlalchemy import apaginate
 from fastapi_pagination.limit_offset import LimitOffsetPage
 from pydantic import BaseModel
 from shared.exceptions import DatabaseException
-from shared.types import ID
+from shared.types import ID, EnvironmentType
 from shared.utils import get_obj_or_type_value as call
+from sqlalchemy import delete, exists, insert, tuple_
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import joinedload, selectinload, subqueryload
-from sqlmodel import SQLModel, col, or_, select
+from sqlalchemy.orm import InstrumentedAttribute, joinedload, raiseload, selectinload, subqueryload
+from sqlmodel import SQLModel, and_, col, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
@@ -25,6 +30,62 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 logger = get_logger(__name__)
 
+# Combines the per-field conditions of `delete_many_with_criteria`, keyed by its `operator` argument
+_CRITERIA_COMBINERS: dict[str, Callable[..., Any]] = {
+    "AND": and_,
+    "OR": or_,
+    "IN": and_,
+}
+
+# Outside production every lookup turns unrequested relationship loads into errors, surfacing N+1 access in dev and CI
+_RAISE_ON_LAZY_LOAD = settings.APP_ENVIRONMENT != EnvironmentType.PRODUCTION
+
+
+@cache
+def _model_columns(model: type[SQLModel]) -> dict[str, InstrumentedAttribute[Any]]:
+    """
+    Maps the column attribute names of a model to their instrumented attributes, built once per model.
+
+    Args:
+        model (type[SQLModel]): The mapped model class
+
+    Returns:
+        dict[str, InstrumentedAttribute[Any]]: The column attributes keyed by name
+    """
+
+    return {attr.key: getattr(model, attr.key) for attr in sa_inspect(model).column_attrs}
+
+
+@cache
+def _model_relationships(model: type[SQLModel]) -> dict[str, InstrumentedAttribute[Any]]:
+    """
+    Maps the relationship names of a model to their instrumented attributes, built once per model.
+
+    Args:
+        model (type[SQLModel]): The mapped model class
+
+    Returns:
+        dict[str, InstrumentedAttribute[Any]]: The relationship attributes keyed by name
+    """
+
+    return {attr.key: getattr(model, attr.key) for attr in sa_inspect(model).relationships}
+
+
+@lru_cache(maxsize=256)
+def _page_class(page_kind: type[CursorPage[Any]] | type[LimitOffsetPage[Any]], page_schema: Any) -> type[Any]:
+    """
+    Returns the page class parametrized with the given schema, built once per (page kind, schema) pair.
+
+    Args:
+        page_kind (type[CursorPage[Any]] | type[LimitOffsetPage[Any]]): The generic page class
+        page_schema (Any): The schema type for the paginated response items
+
+    Returns:
+        type[Any]: The parametrized page class
+    """
+
+    return page_kind[page_schema]  # type: ignore[index]
+
 
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
@@ -34,16 +95,19 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: type[ModelType], session: AsyncSession):
         self.model = model
         self.session = session
+        self._columns = _model_columns(model)
+        self._relationships = _model_relationships(model)
 
     async def paginate(
         self,
         *,
         query: Any,
-        count_query: Any,
         filters: Filter | None,
         cursor_params: CursorParams,
         page_schema: type[BaseModel] | ModelType,
         transformer: Callable[..., Any] | None,
+        count_query: Any | None = None,
+        include_total: bool = False,
     ) -> CursorPage[Any]:
         """
         Paginate records of the models that returns a `CursorPage[PageSchema]` using keyset pagination.
@@ -53,7 +117,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             filter (Filter): Filter instance to apply filtering and sorting
             cursor_params (CursorParams): Cursor pagination parameters
             page_schema: The schema type for the paginated response items
-            count_query (Any): Optional count query for total records (if None, total won't be included)
+            count_query (Any | None): Optional count query for total records, only used when `include_total` is set.
+                When omitted the filtered query is counted as a subquery.
+            include_total (bool): Whether to run a count query and include the total in the page
             transformer (Callable[..., Any] | None): Optional function to transform query results before returning
 
         Returns:
@@ -70,6 +136,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 cursor_params=pagination_data,
                 page_schema=UserSchema,
                 count_query=select(func.count(User.id)),
+                include_total=True,
                 transformer=lambda users: [UserSchema.to_schema(user) for user in users],
             )
             ```
@@ -78,15 +145,15 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             filtered_query = query
 
             if filters:
-                filtered_query = filters.sort(filters.filter(query))  # type: ignore
+                filtered_query = filters.apply(query)  # type: ignore
 
-            set_page(CursorPage[page_schema])
-            set_params(cursor_params)  # type: ignore
+            set_page(_page_class(CursorPage, page_schema))
+            set_params(cursor_params.with_total(include_total))  # type: ignore
 
             paginated_result = await apaginate(  # type: ignore
                 conn=self.session,
                 query=filtered_query,  # type: ignore
-                count_query=count_query,
+                count_query=count_query if include_total else None,
                 transformer=transformer if transformer else None,
             )
 
@@ -101,11 +168,12 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         self,
         *,
         query: Any,
-        count_query: Any,
         filters: Filter | None,
         limit_offset_params: LimitOffsetParams,
         page_schema: type[BaseModel] | ModelType,
         transformer: Callable[..., Any] | None,
+        count_query: Any | None = None,
+        include_total: bool = False,
     ) -> LimitOffsetPage[Any]:
         """
         Paginate records of the models that returns a `LimitOffsetPage[PageSchema]` using limit and offset pagination.
@@ -115,7 +183,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             filter (Filter): Filter instance to apply filtering and sorting
             limit_offset_params (LimitOffsetParams): Limit-offset pagination parameters
             page_schema: The schema type for the paginated response items
-            count_query (Any): Optional count query for total records (if None, total won't be included)
+            count_query (Any | None): Optional count query for total records, only used when `include_total` is set.
+                When omitted the filtered query is counted as a subquery.
+            include_total (bool): Whether to run a count query and include the total in the page
             transformer (Callable[..., Any] | None): Optional function to transform query results before returning
 
         Returns:
@@ -128,15 +198,15 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             filtered_query = query
 
             if filters:
-                filtered_query = filters.sort(filters.filter(query))  # type: ignore
+                filtered_query = filters.apply(query)  # type: ignore
 
-            set_page(LimitOffsetPage[page_schema])
-            set_params(limit_offset_params)  # type: ignore
+            set_page(_page_class(LimitOffsetPage, page_schema))
+            set_params(limit_offset_params.with_total(include_total))  # type: ignore
 
             paginated_result = await apaginate(  # type: ignore
                 conn=self.session,
                 query=filtered_query,  # type: ignore
-                count_query=count_query,
+                count_query=count_query if include_total else None,
                 transformer=transformer if transformer else None,
             )
 
@@ -155,11 +225,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             List of all records
         """
         try:
-            query = select(self.model)
-            if where:
-                for field, value in where.items():
-                    if hasattr(self.model, field):
-                        query = query.where(col(getattr(self.model, field)) == value)
+            query = self._guard_lazy_loads(select(self.model).where(*self._equality_conditions(where)))
 
             result = await self.session.exec(query)
             return list(result.all())
@@ -168,12 +234,41 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 message="Failed to retrieve records",
             ) from e
 
+    async def iter_all(self, where: dict[str, Any] | None = None, batch_size: int = 500) -> AsyncIterator[ModelType]:
+        """
+        Iterate over all records of the model without materializing the full result.
+
+        Rows are streamed from a server-side cursor and fetched `batch_size` at a time, so memory stays bounded
+        by the batch rather than the result size.
+
+        Args:
+            where (dict[str, Any] | None): Field names and values to filter by
+            batch_size (int): Number of rows fetched per round-trip
+
+        Yields:
+            ModelType: Each matching record
+
+        Raises:
+            DatabaseException: If the query fails
+        """
+        try:
+            query = self._guard_lazy_loads(select(self.model).where(*self._equality_conditions(where)))
+            query = query.execution_options(yield_per=batch_size)
+
+            result = await self.session.stream_scalars(query)
+            async for record in result:
+                yield record
+        except SQLAlchemyError as e:
+            raise DatabaseException(
+                message="Failed to retrieve records",
+            ) from e
+
     async def find_all_in(
         self,
         field: str,
         values: list[Any],
         preload_relationships: list[str] | None = None,
-        load_strategy: Literal["selectin", "joined", "subquery"] | None = None,
+        load_strategy: Literal["selectin", "joined", "subquery"] | None = "selectin",
     ) -> list[ModelType]:
         """
         Find all records where a field's value is in the provided list (IN operator).
@@ -183,7 +278,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             values: List of values to match using the SQL IN operator
             preload_relationships: Optional list of relationship attribute names to preload
             load_strategy: Optional loading strategy to use for the preloads ("selectin", "joined", "subquery").
-                If None (default) no preload loading strategy will be applied even if `preload_relationships` is provided.
+                Defaults to "selectin", "joined" should only be used for many-to-one or one-to-one relationships
+                since it multiplies rows on collections. If None no preload loading strategy will be applied even if
+                `preload_relationships` is provided.
 
         Returns:
             List of matching records
@@ -192,10 +289,10 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             if not values:
                 return []
 
-            if not hasattr(self.model, field):
+            if field not in self._columns:
                 return []
 
-            column = col(getattr(self.model, field))
+            column = self._columns[field]
             query = select(self.model).where(column.in_(values))  # type: ignore
 
             if preload_relationships and load_strategy is not None:
@@ -211,8 +308,10 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                     )
 
                 for relationship in preload_relationships:
-                    if hasattr(self.model, relationship):
-                        query = query.options(loader(getattr(self.model, relationship)))
+                    if relationship in self._relationships:
+                        query = query.options(loader(self._relationships[relationship]))
+
+            query = self._guard_lazy_loads(query)
 
             result = await self.session.exec(query)
             return list(result.all())
@@ -236,10 +335,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             The found record or None
         """
         try:
-            query = select(self.model)
-            for field, value in kwargs.items():
-                if hasattr(self.model, field):
-                    query = query.where(col(getattr(self.model, field)) == value)
+            query = self._guard_lazy_loads(select(self.model).where(*self._equality_conditions(kwargs)))
             result = await self.session.exec(query)
             return result.one_or_none()
         except SQLAlchemyError as e:
@@ -265,16 +361,12 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         try:
             query = select(self.model)
-            conditions = [
-                col(getattr(self.model, field)) == value
-                for field, value in kwargs.items()
-                if hasattr(self.model, field)
-            ]
+            conditions = [self._columns[field] == value for field, value in kwargs.items() if field in self._columns]
 
             if not conditions:
                 return None
 
-            query = query.filter(or_(*conditions))
+            query = self._guard_lazy_loads(query.filter(or_(*conditions)))
             result = await self.session.exec(query)
             return result.one_or_none()
         except SQLAlchemyError as e:
@@ -294,7 +386,8 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Args:
             criteria: Field names and values to filter by
             preload_relationships: List of relationship attribute names to preload
-            load_strategy: The loading strategy to use ("selectin", "joined", "subquery")
+            load_strategy: The loading strategy to use ("selectin", "joined", "subquery"). "joined" should only be
+                used for many-to-one or one-to-one relationships since it multiplies rows on collections.
 
         Returns:
             The found record with preloaded relationships or None
@@ -303,11 +396,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             DatabaseException: If the query fails or an invalid load strategy is provided
         """
         try:
-            query = select(self.model)
-
-            for field, value in criteria.items():
-                if hasattr(self.model, field):
-                    query = query.where(col(getattr(self.model, field)) == value)
+            query = select(self.model).where(*self._equality_conditions(criteria))
 
             if preload_relationships:
                 if load_strategy == "selectin":
@@ -322,8 +411,10 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                     )
 
                 for relationship in preload_relationships:
-                    if hasattr(self.model, relationship):
-                        query = query.options(loader(getattr(self.model, relationship)))
+                    if relationship in self._relationships:
+                        query = query.options(loader(self._relationships[relationship]))
+
+            query = self._guard_lazy_loads(query)
 
             result = await self.session.exec(query)
             return result.one_or_none()
@@ -336,12 +427,13 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 message="Failed to find record with preloads",
             ) from e
 
-    async def create(self, schema: CreateSchemaType | dict[str, Any]) -> ModelType:
+    async def create(self, schema: CreateSchemaType | dict[str, Any], refresh: bool = False) -> ModelType:
         """
         Create a new record.
 
         Args:
             schema: The data to create the record with
+            refresh: Whether to reload the record after saving, server defaults are already fetched on insert
 
         Returns:
             The created record
@@ -357,7 +449,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 call(db_obj, "set_friendly_fields")
 
             self.session.add(db_obj)
-            await self.save_changes(refresh_obj=db_obj)
+            await self.save_changes(refresh_obj=db_obj if refresh else None)
             return db_obj
         except SQLAlchemyError as e:
             raise DatabaseException(
@@ -370,47 +462,101 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         Create a new record if it does not already exist based on unique fields.
 
+        Uses a single `INSERT ... ON CONFLICT DO NOTHING RETURNING` and only reads the existing row back when the
+        insert conflicted, so the check and the insert cannot race.
+
         Args:
             schema: The data to create the record with
-            unique_fields: List of field names that should be unique
+            unique_fields: Columns covered by a unique constraint or index on the table, used as the conflict target
         Returns:
             The created or existing record
+
+        Raises:
+            DatabaseException: If `unique_fields` is empty or names fields that are not columns of the table, the
+                insert fails, or the conflicting record is deleted before it can be read
         """
 
+        if not unique_fields:
+            raise DatabaseException(
+                message="`unique_fields` must name at least one column to detect existing records by",
+            )
+
+        unknown_fields = [field for field in unique_fields if field not in self._columns]
+        if unknown_fields:
+            raise DatabaseException(
+                message=f"`unique_fields` are not columns of {self.model.__name__}: {', '.join(unknown_fields)}",
+            )
+
         try:
-            filter_kwargs = {field: getattr(schema, field) for field in unique_fields if hasattr(schema, field)}
-            existing_entity = await self.find_one_by_and_none(**filter_kwargs)
+            if isinstance(schema, dict):
+                db_obj = self.model(**schema)
+            else:
+                db_obj = self.model(**schema.model_dump())
 
-            if existing_entity:
-                return existing_entity
+            if hasattr(db_obj, "set_friendly_fields"):
+                call(db_obj, "set_friendly_fields")
+
+            row = {key: value for key, value in sa_inspect(db_obj).dict.items() if key in self._columns}
 
-            return await self.create(schema)
+            query = (
+                pg_insert(self.model)
+                .values(row)
+                .on_conflict_do_nothing(index_elements=unique_fields)
+                .returning(self.model)
+            )
+            created_entity = (await self.session.exec(query)).scalars().one_or_none()
+
+            if created_entity is not None:
+                await self.save_changes()
+                return created_entity
+
+            existing_entity = await self.find_one_by_and_none(**{field: row.get(field) for field in unique_fields})
         except SQLAlchemyError as e:
             raise DatabaseException(
                 message="Failed to create record",
             ) from e
 
+        if existing_entity is None:
+            raise DatabaseException(message="Existing record was removed before it could be read")
+
+        return existing_entity
+
     async def create_many(self, schemas: list[CreateSchemaType]) -> list[ModelType]:
         """
         Create multiple records.
 
+        The rows are written with a single bulk `INSERT ... RETURNING`, so generated values such as server-side
+        timestamps come back in the same round-trip.
+
         Args:
             schemas: The data to create the records with
 
         Returns:
-            The created records
+            The created records, in the order of `schemas`
         """
 
         try:
+            if not schemas:
+                return []
+
             db_objs = [self.model(**schema.model_dump()) for schema in schemas]
 
             for db_obj in db_objs:
                 if hasattr(db_obj, "set_friendly_fields"):
                     call(db_obj, "set_friendly_fields")
 
-            self.session.add_all(db_objs)
+            # Only the columns set on the object are sent, unset ones fall back to their column defaults
+            rows = [
+                {key: value for key, value in sa_inspect(db_obj).dict.items() if key in self._columns}
+                for db_obj in db_objs
+            ]
+
+            query = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+            result = await self.session.exec(query, params=rows)
+            created_objs = list(result.scalars().all())
+
             await self.save_changes()
-            return db_objs
+            return created_objs
         except SQLAlchemyError as e:
             raise DatabaseException(
                 message="Failed to create records",
@@ -429,32 +575,50 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             The created or existing records
         """
 
-        created_entities: list[ModelType] = []
-
         try:
-            for schema in schemas:
-                filter_kwargs = {field: getattr(schema, field) for field in unique_fields if hasattr(schema, field)}
-                existing_entity = await self.find_one_by_and_none(**filter_kwargs)
+            if not schemas:
+                return []
 
-                if existing_entity:
-                    created_entities.append(existing_entity)
-                else:
-                    new_entity = await self.create(schema)
-                    created_entities.append(new_entity)
+            fields = [field for field in unique_fields if field in self._columns and hasattr(schemas[0], field)]
+
+            if not fields:
+                return await self.create_many(schemas)
+
+            keys = [tuple(getattr(schema, field) for field in fields) for schema in schemas]
 
-            return created_entities
+            columns = [self._columns[field] for field in fields]
+            query = select(self.model).where(tuple_(*columns).in_(keys))
+            result = await self.session.exec(query)
+            existing_entities: dict[tuple[Any, ...], ModelType] = {
+                tuple(getattr(entity, field) for field in fields): entity for entity in result.all()
+            }
+
+            # Schemas repeating a key within the batch resolve to the same row instead of inserting duplicates
+            new_schemas: dict[tuple[Any, ...], CreateSchemaType] = {}
+            for schema, key in zip(schemas, keys, strict=True):
+                if key not in existing_entities:
+                    new_schemas.setdefault(key, schema)
+
+            if new_schemas:
+                created_entities = await self.create_many(list(new_schemas.values()))
+                existing_entities.update(zip(new_schemas, created_entities, strict=True))
+
+            return [existing_entities[key] for key in keys]
         except SQLAlchemyError as e:
             raise DatabaseException(
                 message="Failed to create records",
             ) from e
 
-    async def update(self, id: ID, schema: UpdateSchemaType | dict[str, Any]) -> ModelType | None:
+    async def update(
+        self, id: ID, schema: UpdateSchemaType | dict[str, Any], refresh: bool = False
+    ) -> ModelType | None:
         """
         Update a record by ID.
 
         Args:
             id: The id of the record to update
             schema: The data to update the record with
+            refresh: Whether to reload the record after saving, `onupdate` values are already fetched on update
 
         Returns:
             The updated record or None if not found
@@ -475,7 +639,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
             existing_entity.sqlmodel_update(updated_fields)
             self.session.add(existing_entity)
-            await self.save_changes(refresh_obj=existing_entity)
+            await self.save_changes(refresh_obj=existing_entity if refresh else None)
 
             return existing_entity
         except SQLAlchemyError as e:
@@ -494,10 +658,16 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
 
         try:
+            if not ids:
+                return []
+
+            query = select(self.model).where(col(self.model.id).in_(ids))  # type: ignore
+            existing_entities = {entity.id: entity for entity in (await self.session.exec(query)).all()}  # type: ignore
+
             updated_entities: list[ModelType] = []
 
             for record_id, record_schema in zip(ids, schema):
-                existing_entity = await self.find_one_by_and_none(id=record_id)
+                existing_entity = existing_entities.get(record_id)
 
                 if not existing_entity:
                     continue
@@ -514,6 +684,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 self.session.add(existing_entity)
                 updated_entities.append(existing_entity)
 
+            # All pending updates are flushed together, one UPDATE batch instead of a round-trip per row
             await self.save_changes()
 
             return updated_entities
@@ -534,13 +705,13 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
 
         try:
-            query = select(self.model).where(col(self.model.id) == id)  # type: ignore
-            result = (await self.session.exec(query)).one_or_none()
+            # Single DELETE ... RETURNING, the row is never loaded into the session
+            query = delete(self.model).where(col(self.model.id) == id).returning(col(self.model.id))  # type: ignore
+            result = await self.session.exec(query)
 
-            if not result:
+            if result.first() is None:
                 return False
 
-            await self.session.delete(result)
             await self.save_changes()
             return True
         except SQLAlchemyError as e:
@@ -560,20 +731,12 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
 
         try:
-            query = select(self.model)
-
-            for field, value in where.items():
-                if hasattr(self.model, field):
-                    query = query.where(col(getattr(self.model, field)) == value)
+            query = delete(self.model).where(*self._equality_conditions(where))
 
-            results = await self.session.exec(query)
-            records_to_delete = results.all()
-
-            for record in records_to_delete:
-                await self.session.delete(record)
+            result = await self.session.exec(query)
 
             await self.save_changes()
-            return len(records_to_delete)
+            return result.rowcount
         except SQLAlchemyError as e:
             raise DatabaseException(
                 message="Failed to delete records",
@@ -594,15 +757,11 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             if len(ids) == 0:
                 return 0
 
-            query = select(self.model).where(col(self.model.id).in_(ids))  # type: ignore
-            results = await self.session.exec(query)
-            records_to_delete = results.all()
-
-            for record in records_to_delete:
-                await self.session.delete(record)
+            query = delete(self.model).where(col(self.model.id).in_(ids))  # type: ignore
+            result = await self.session.exec(query)
 
             await self.save_changes()
-            return len(records_to_delete)
+            return result.rowcount
         except SQLAlchemyError as e:
             raise DatabaseException(
                 message="Failed to delete records",
@@ -616,49 +775,40 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         Args:
             where (dict[str, Any]): Field names and values to filter by
-            op (Literal['and', 'or', "in"]): The logical operator to use for combining conditions ('and', 'or', 'in')
+            operator (Literal["AND", "OR", "IN"]): How the per-field conditions are combined. "IN" combines them like
+                "AND", list values match with IN under every operator
 
         Returns:
             The number of records deleted
+
+        Raises:
+            DatabaseException: If the operator is invalid or the delete fails
         """
 
         try:
-            query = select(self.model)
-            conditions = []
-
-            for field, value in where.items():
-                if hasattr(self.model, field):
-                    column = col(getattr(self.model, field))
-                    # Use IN operator if value is a list
-                    if isinstance(value, list):
-                        conditions.append(column.in_(value))
-                    elif operator == "AND":
-                        conditions.append(column == value)
-                    elif operator == "OR":
-                        conditions.append(column == value)
-                    elif operator == "IN":
-                        if isinstance(value, list):
-                            conditions.append(column.in_(value))
-                        else:
-                            conditions.append(column.in_([value]))
+            combine = _CRITERIA_COMBINERS.get(operator)
+            if combine is None:
+                raise ValueError(f"Invalid operator: {operator}. Must be one of: 'AND', 'OR', 'IN'")
 
-            if conditions:
-                if operator == "AND":
-                    for condition in conditions:
-                        query = query.where(condition)
-                elif operator == "OR":
-                    query = query.filter(or_(*conditions))
-                elif operator == "IN":
-                    query = query.filter(*conditions)
+            # One condition per field, list values always match with IN
+            conditions = [
+                self._columns[field].in_(value) if isinstance(value, list) else self._columns[field] == value
+                for field, value in where.items()
+                if field in self._columns
+            ]
 
-            results = await self.session.exec(query)
-            records_to_delete = results.all()
+            query = delete(self.model)
+            if conditions:
+                query = query.where(combine(*conditions))
 
-            for record in records_to_delete:
-                await self.session.delete(record)
+            result = await self.session.exec(query)
 
             await self.save_changes()
-            return len(records_to_delete)
+            return result.rowcount
+        except ValueError as ve:
+            raise DatabaseException(
+                message=str(ve),
+            ) from ve
         except SQLAlchemyError as e:
             raise DatabaseException(
                 message="Failed to delete records",
@@ -676,15 +826,15 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
 
         try:
-            query = select(self.model).where(col(self.model.id) == id)  # type: ignore
+            query = select(exists().where(col(self.model.id) == id))  # type: ignore
             result = await self.session.exec(query)
-            return result.one_or_none() is not None
+            return bool(result.one())
         except SQLAlchemyError as e:
             raise DatabaseException(
                 message="Failed to check existence of record",
             ) from e
 
-    async def exists_one(self) -> ModelType | None:
+    async def exists_one(self) -> bool:
         """
         Check if at least one record exists.
 
@@ -693,9 +843,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
 
         try:
-            query = select(self.model)
+            query = select(exists().select_from(self.model))
             result = await self.session.exec(query)
-            return result.first()
+            return bool(result.one())
         except SQLAlchemyError as e:
             raise DatabaseException(
                 message="Failed to check existence of record",
@@ -720,6 +870,39 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 message="Failed to execute raw query",
             ) from e
 
+    def _guard_lazy_loads(self, query: Any) -> Any:
+        """
+        Makes relationships that were not explicitly preloaded raise on access, outside production only.
+
+        Args:
+            query (Any): The select query to guard
+
+        Returns:
+            Any: The query, with `raiseload("*")` applied when the guard is enabled
+        """
+
+        if _RAISE_ON_LAZY_LOAD:
+            return query.options(raiseload("*"))
+        return query
+
+    def _equality_conditions(self, criteria: dict[str, Any] | None) -> list[Any]:
+        """
+        Builds one equality condition per known column in `criteria`, unknown fields are ignored.
+
+        The conditions are applied in a single `where(*conditions)` so queries over the same fields compile to
+        identical SQL and hit the statement cache.
+
+        Args:
+            criteria (dict[str, Any] | None): Field names and values to filter by
+
+        Returns:
+            list[Any]: The equality conditions
+        """
+
+        if not criteria:
+            return []
+        return [self._columns[field] == value for field, value in criteria.items() if field in self._columns]
+
     async def save_changes(self, refresh_obj=None):
         """
         Save changes to the database, respecting transaction context.
@@ -730,7 +913,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Args:
             refresh_obj: Object to refresh after saving changes
         """
-        if in_transaction():
+        if in_transaction(self.session):
             await self.session.flush()
         else:
             await self.session.commit()
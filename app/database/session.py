@@ -1,7 +1,8 @@
-import json
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
+import orjson
 from core.settings import settings
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.ext.asyncio.session import async_sessionmaker
@@ -9,13 +10,26 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 DATABASE_URL = str(settings.SQLALCHEMY_DATABASE_URI)
 
+
+def _json_dumps(obj: Any) -> str:
+    # Non-str keys are stringified like the stdlib encoder does, unknown types fall back to str()
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 engine = create_async_engine(
     url=DATABASE_URL,
     pool_pre_ping=True,
     pool_recycle=3600,
     pool_size=20,
     max_overflow=0,
-    json_serializer=lambda obj: json.dumps(obj),
+    # Reusing the most recently returned connection keeps its server-side prepared statements warm
+    pool_use_lifo=True,
+    query_cache_size=1200,
+    echo=False,
+    # psycopg prepares a statement server-side once it has run this many times on a connection
+    connect_args={"prepare_threshold": 2},
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
 )
 
 SessionLocal = async_sessionmaker(
@@ -1,4 +1,3 @@
-from contextvars import ContextVar
 from typing import Self
 
 from core.logging import get_logger
@@ -6,7 +5,8 @@ from sqlalchemy.ext.asyncio.session import AsyncSession
 
 logger = get_logger(__name__)
 
-_transaction_level = ContextVar("transaction_level", default=0)
+# Key of the current transaction nesting depth in the session's `info` dictionary
+_TX_DEPTH_KEY = "tx_depth"
 
 
 class Transaction:
@@ -19,17 +19,19 @@ class Transaction:
 
     Supports nested transactions - only the outermost transaction will actually commit.
     Inner transactions just manage their scope and participate in the outer transaction.
+
+    The nesting depth is tracked in the session's `info` dictionary, so transaction state follows
+    the session rather than the async context it happens to run in.
     """
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
-        self.token = None
         self.is_outermost = False
 
     async def __aenter__(self) -> Self:
-        level = _transaction_level.get()
+        level = self.session.info.get(_TX_DEPTH_KEY, 0)
         self.is_outermost = level == 0
-        self.token = _transaction_level.set(level + 1)
+        self.session.info[_TX_DEPTH_KEY] = level + 1
 
         if self.is_outermost:
             logger.debug("Starting outermost transaction")
@@ -52,11 +54,10 @@ class Transaction:
             if self.is_outermost:
                 await self.session.commit()
         finally:
-            if self.token is not None:
-                _transaction_level.reset(self.token)
+            self.session.info[_TX_DEPTH_KEY] -= 1
 
         return True
 
 
-def in_transaction() -> bool:
-    return _transaction_level.get() > 0
+def in_transaction(session: AsyncSession) -> bool:
+    return session.info.get(_TX_DEPTH_KEY, 0) > 0
@@ -1,8 +1,12 @@
+import re
 from typing import Any
 
 from sqlalchemy import CHAR, TypeDecorator
 from ulid import ULID
 
+# Canonical (uppercase Crockford base32) ULID strings, the first character caps the value at 128 bits
+_CANONICAL_ULID = re.compile(r"[0-7][0-9A-HJKMNP-TV-Z]{25}")
+
 
 class ULIDType(TypeDecorator):
     """
@@ -22,6 +26,8 @@ class ULIDType(TypeDecorator):
         if isinstance(value, ULID):
             return str(value)
         if isinstance(value, str):
+            if _CANONICAL_ULID.fullmatch(value):
+                return value
             return str(ULID.from_str(value))
 
         raise ValueError(f"Cannot convert {type(value)} to ULID string")
@@ -29,16 +35,11 @@ class ULIDType(TypeDecorator):
     def process_result_value(self, value: str | None, dialect: Any) -> str | None:
         """
         Convert database string to Python ULID string.
-        """
 
-        if value is None:
-            return None
+        Values were written through `process_bind_param` in canonical form, so they are returned as-is.
+        """
 
-        try:
-            ulid = ULID.from_str(value)
-            return str(ulid)
-        except Exception as e:
-            raise ValueError(f"Cannot convert database value to ULID: {e}")
+        return value
 
     def load_dialect_impl(self, dialect):
         return dialect.type_descriptor(CHAR(26))
@@ -2,7 +2,7 @@ import logging
 
 from sqlmodel import text
 
-from .session import db_session_manager
+from .session import engine
 
 logger = logging.getLogger(__name__)
 
@@ -11,14 +11,15 @@ async def check_db_connection() -> bool:
     """
     Performs a simple database connectivity check by running `SELECT 1`.
 
+    The query runs on a pooled connection directly, without building a session around it.
+
     Returns:
         True if the database responded to the query, False otherwise.
     """
 
     try:
-        async with db_session_manager() as session:
-            query = await session.exec(text("SELECT 1"))  # type: ignore
-            _ = query.one()
+        async with engine.connect() as connection:
+            await connection.scalar(text("SELECT 1"))
             return True
 
     except Exception as exc:
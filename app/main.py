@@ -1,26 +1,31 @@
 from bootstrap import create_app
 from core.initializers import run_migrations
 from core.logging import configure_logging
+from core.middlewares.health_check import HealthCheckInterceptor
 from core.settings import settings
-from shared.types import EnvironmentType
 
 configure_logging()
 
-run_migrations()
-
-app = create_app()
+# Probes are answered before the application so they skip its middleware stack
+app = HealthCheckInterceptor(create_app())
 
 
 if __name__ == "__main__":
     import uvicorn
 
+    # Runs once in this process, the workers and the reloader import `main` without executing this block
+    run_migrations()
+
     uvicorn.run(
         "main:app",
+        # uvloop is selected per server loop rather than installed globally, nothing runs on an event loop before
+        # this point and `uvloop.install()` / loop policies are deprecated on the Python versions we target
         loop="uvloop",
         host="0.0.0.0",
         port=settings.APP_PORT,
         log_level=settings.APP_LOG_LEVEL.lower(),
-        reload=True if settings.APP_ENVIRONMENT == EnvironmentType.LOCAL else False,
+        reload=settings.APP_IS_LOCAL,
+        workers=settings.APP_WORKERS_COUNT,
         log_config=None,
         proxy_headers=True,
     )
@@ -85,6 +85,12 @@ async def run_async_migrations() -> None:
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
 
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        # A connection was provided by the caller (e.g. `run_migrations` on startup), so reuse it
+        do_run_migrations(connection)
+        return
+
     asyncio.run(run_async_migrations())
 
 
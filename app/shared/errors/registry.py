@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import Callable, Self
 
 from core.settings import settings
@@ -31,18 +32,26 @@ class ExceptionHandlerRegistry:
 
     def __init__(self):
         self._handlers: dict[type[Exception], Callable] = {}
+        self._frozen: MappingProxyType[type[Exception], Callable] | None = None
 
     def register(self, exception_class: type[Exception], handler: Callable) -> Self:
         self._handlers[exception_class] = handler
+        self._frozen = None
         return self
 
     def register_many(self, handlers: dict[type[Exception], Callable]) -> Self:
         self._handlers.update(handlers)
+        self._frozen = None
         return self
 
     @property
-    def handlers(self) -> dict[type[Exception], Callable]:
-        return self._handlers.copy()
+    def handlers(self) -> MappingProxyType[type[Exception], Callable]:
+        """
+        Read-only view of the registered handlers, rebuilt only after a registration.
+        """
+        if self._frozen is None:
+            self._frozen = MappingProxyType(dict(self._handlers))
+        return self._frozen
 
 
 exception_registry = ExceptionHandlerRegistry()
@@ -64,10 +73,11 @@ exception_registry.register_many(
 
 eh = new_exception_handler(
     cors=CorsConfiguration(
-        allow_origins=[str(origin).strip("/") for origin in settings.APP_CORS_ORIGINS],
+        allow_origins=list(settings.APP_CORS_ORIGINS_NORMALIZED),
         allow_methods=["*"],
         allow_headers=["*"],
         allow_credentials=True,
     ),
-    handlers=exception_registry.handlers,
+    # `new_exception_handler` adds its default handlers to the given dict in place
+    handlers=dict(exception_registry.handlers),
 )
@@ -7,6 +7,11 @@ from shared.utils import get_obj_or_type_value
 
 logger = get_logger(__name__)
 
+_INTERNAL_SERVER_ERROR_DETAIL = (
+    "An unexpected error occurred while trying to process your request. Please try again later."
+)
+_INTERNAL_SERVER_ERROR_TYPE = "internal_server_error"
+
 
 def create_problem_handler(status_code: int, title: str, detail_message: str | None = None) -> Callable:
     """
@@ -21,21 +26,21 @@ def create_problem_handler(status_code: int, title: str, detail_message: str | N
         A callable problem handler function.
     """
 
+    # Resolved once per handler rather than on every exception
+    is_internal_server_error = status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
     def handler(_eh, request: Request, exc: type[Exception]) -> Problem:
-        if status_code == status.HTTP_500_INTERNAL_SERVER_ERROR:
+        if is_internal_server_error:
             logger.error(
                 "Unhandled generic exception caught",
-                exc_info=(exc.__class__, exc, get_obj_or_type_value(exc, "__traceback__", None)),
+                exc_info=(exc.__class__, exc, exc.__traceback__),
             )
-            detail = "An unexpected error occurred while trying to process your request. Please try again later."
-            error_type = "internal_server_error"
-            headers = {}
 
             return Problem(
                 title=title,
-                type_=error_type,
+                type_=_INTERNAL_SERVER_ERROR_TYPE,
                 status=status_code,
-                detail=detail,
+                detail=_INTERNAL_SERVER_ERROR_DETAIL,
                 instance=str(request.url.path),
             )
 
@@ -3,13 +3,14 @@ class AuthenticationException(Exception):
     Base auth exception
     """
 
+    error_type = "authentication_error"
+
     def __init__(
         self,
         message: str = "Authentication error",
         headers: dict[str, str] | None = None,
     ) -> None:
         self.message = message
-        self.error_type = "authentication_error"
         self.headers = headers or {}
 
         super().__init__(self.message)
@@ -3,9 +3,10 @@ class BadRequestException(Exception):
     Bad request error
     """
 
+    error_type = "bad_request"
+
     def __init__(self, message: str = "Invalid request."):
         self.message = message
-        self.error_type = "bad_request"
 
         super().__init__(self.message)
 
@@ -15,9 +16,10 @@ class ResourceNotFoundException(Exception):
     Resource not found
     """
 
+    error_type = "resource_not_found"
+
     def __init__(self, resource_name: str | None = None):
         self.message = f"{resource_name} not found." if resource_name else "Resource not found."
-        self.error_type = "resource_not_found"
 
         super().__init__(self.message)
 
@@ -27,8 +29,9 @@ class AppException(Exception):
     Generic application exception to used for service related errors
     """
 
+    error_type = "app_error"
+
     def __init__(self, message: str):
         self.message = message
-        self.error_type = "app_error"
 
         super().__init__(self.message)
@@ -1,5 +1,5 @@
 from .aliases import ID
-from .enums import EnvironmentType
+from .enums import EnvironmentType, StartupState
 from .schemas import IResponse, RequestInfo
 
-__all__ = ["ID", "EnvironmentType", "IResponse", "RequestInfo"]
+__all__ = ["ID", "EnvironmentType", "IResponse", "RequestInfo", "StartupState"]
@@ -14,3 +14,18 @@ class EnvironmentType(StrEnum):
     LOCAL = "local"
     STAGING = "staging"
     PRODUCTION = "production"
+
+
+class StartupState(StrEnum):
+    """
+    Enumeration for the progress of the application's deferred startup actions.
+
+    Attributes:
+        STARTING (str): The startup actions are still running.
+        READY (str): Every startup action completed, the application can serve traffic.
+        FAILED (str): A startup action failed, the process has to be restarted.
+    """
+
+    STARTING = "starting"
+    READY = "ready"
+    FAILED = "failed"
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Generic, TypeVar
 
@@ -16,14 +17,14 @@ class RequestInfo:
         ip_address (str | None): The IP address from which the request originated.
         user_agent (str | None): The user agent string of the client making the request.
         request_id (str | None): An optional unique identifier for the request.
-        cookies (dict[str, str]): The cookies from the request.
+        cookies (Mapping[str, str]): The cookies from the request.
         authorization (str | None): The extracted bearer token from the Authorization header.
     """
 
     ip_address: str | None = None
     user_agent: str | None = None
     request_id: str | None = None
-    cookies: dict[str, str] = field(default_factory=dict)
+    cookies: Mapping[str, str] = field(default_factory=dict)
     authorization: str | None = None
 
 
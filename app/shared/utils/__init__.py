@@ -1,5 +1,5 @@
 from .h3_utils import H3Utils
-from .location_utils import LocationUtils
+from .location_utils import LocationUtils, location_utils
 from .object_utils import get_obj_or_type_value
 from .pydantic_utils import optional
 from .request_utils import get_request_info
@@ -17,4 +17,5 @@ __all__ = [
     "validate_list",
     "H3Utils",
     "LocationUtils",
+    "location_utils",
 ]
@@ -1,14 +1,17 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Any, Set, Tuple
+from functools import lru_cache
+from typing import Any, Tuple
 
-import h3
+import h3.api.basic_int as h3
+from geoalchemy2 import WKTElement
 from geoalchemy2.shape import from_shape, to_shape
 from pydantic_extra_types.coordinate import Latitude, Longitude
-from shapely.geometry import Point, Polygon
+from shapely.geometry import Point
 from shared.constants.property import PROPERTY_EDGE_SPECS
 
 
-@dataclass
+@dataclass(frozen=True)
 class H3Indexes:
     """
     Data class to hold H3 indexes at different resolutions.
@@ -19,25 +22,48 @@ class H3Indexes:
     h3_r9: int
 
 
-class H3Utils:
+@lru_cache(maxsize=8192)
+def _h3_indexes(lat: float, lng: float) -> H3Indexes:
     """
-    Utility class for H3-related operations.
+    Index a point at resolutions 7, 8 and 9.
+
+    Each resolution is indexed from the point itself, H3 cells do not nest exactly so the parent of
+    the r9 cell can differ from the r8 cell near edges. Many listings share coordinates, so results
+    are cached per point.
+
+    Args:
+        lat (float): Latitude
+        lng (float): Longitude
+
+    Returns:
+        H3Indexes: The r7, r8 and r9 cells containing the point
     """
+    return H3Indexes(
+        h3_r7=h3.latlng_to_cell(lat, lng, 7),
+        h3_r8=h3.latlng_to_cell(lat, lng, 8),
+        h3_r9=h3.latlng_to_cell(lat, lng, 9),
+    )
 
-    @staticmethod
-    def _to_int(h3_value: int | str) -> int:
-        """
-        Convert H3 value to integer, handling both int and hex string formats.
 
-        Args:
-            h3_value: H3 index as either int or hex string
+@lru_cache(maxsize=4096)
+def _grid_disk(h3_index: int, k: int) -> frozenset[int]:
+    """
+    Cells within k-ring distance of a cell, cached since radius searches from nearby points overlap heavily.
 
-        Returns:
-            int: H3 index as integer
-        """
-        if isinstance(h3_value, int):
-            return h3_value
-        return int(h3_value, 16)
+    Args:
+        h3_index (int): Center H3 cell
+        k (int): Ring distance
+
+    Returns:
+        frozenset[int]: H3 indexes including the center
+    """
+    return frozenset(h3.grid_disk(h3_index, k))
+
+
+class H3Utils:
+    """
+    Utility class for H3-related operations.
+    """
 
     @staticmethod
     def calculate_h3_indexes(lat: Latitude | float, lng: Longitude | float) -> H3Indexes:
@@ -51,14 +77,22 @@ class H3Utils:
         Returns:
             H3Indexes: An instance of H3Indexes with h3_r7, h3_r8, h3_r9 as integers
         """
-        lat_val = float(lat)
-        lng_val = float(lng)
+        return _h3_indexes(float(lat), float(lng))
+
+    @staticmethod
+    def calculate_h3_indexes_many(coordinates: Iterable[tuple[Latitude | float, Longitude | float]]) -> list[H3Indexes]:
+        """
+        Calculate H3 indexes at multiple resolutions for many lat/lng pairs at once
+
+        Points repeated within or across batches are only indexed once.
 
-        h3_r7 = H3Utils._to_int(h3.latlng_to_cell(lat_val, lng_val, 7))
-        h3_r8 = H3Utils._to_int(h3.latlng_to_cell(lat_val, lng_val, 8))
-        h3_r9 = H3Utils._to_int(h3.latlng_to_cell(lat_val, lng_val, 9))
+        Args:
+            coordinates (Iterable[tuple[Latitude | float, Longitude | float]]): (lat, lng) pairs
 
-        return H3Indexes(h3_r7=h3_r7, h3_r8=h3_r8, h3_r9=h3_r9)
+        Returns:
+            list[H3Indexes]: The indexes of each point, in the order of `coordinates`
+        """
+        return [_h3_indexes(float(lat), float(lng)) for lat, lng in coordinates]
 
     @staticmethod
     def create_point_geometry(lat: Latitude | float, lng: Longitude | float) -> Any:
@@ -98,33 +132,31 @@ class H3Utils:
         """
         Convert H3 index to PostGIS-compatible geometries
 
+        The geometries are formatted as EWKT directly, PostGIS parses it natively so no shapely
+        objects or WKB encoding are needed.
+
         Args:
             h3_index (int): H3 cell index as integer
 
         Returns:
-            Tuple[WKBElement, WKBElement]: Tuple of (center_point_wkt, hexagon_boundary_wkt)
+            Tuple[WKTElement, WKTElement]: Tuple of (center_point_wkt, hexagon_boundary_wkt)
         """
-        h3_str = h3.int_to_str(h3_index)
-        lat, lng = h3.cell_to_latlng(h3_str)
-        center_point = Point(lng, lat)
+        lat, lng = h3.cell_to_latlng(h3_index)
+        center_wkt = WKTElement(f"SRID=4326;POINT({lng} {lat})", extended=True)
 
-        boundary_coords = h3.cell_to_boundary(h3_str)
-        polygon_coords = [(lng, lat) for lat, lng in boundary_coords]
-        hexagon_polygon = Polygon(polygon_coords)
-
-        center_wkt = from_shape(center_point, srid=4326)
-        hexagon_wkt = from_shape(hexagon_polygon, srid=4326)
+        # H3 boundaries are open rings of (lat, lng) vertices, WKT needs (lng lat) and a closed ring
+        boundary_coords = [f"{lng} {lat}" for lat, lng in h3.cell_to_boundary(h3_index)]
+        polygon_coords = ",".join([*boundary_coords, boundary_coords[0]])
+        hexagon_wkt = WKTElement(f"SRID=4326;POLYGON(({polygon_coords}))", extended=True)
 
         return center_wkt, hexagon_wkt
 
     @staticmethod
     def get_parent_h3(h3_index: int, parent_resolution: int = 7) -> int:
-        h3_str = h3.int_to_str(h3_index)
-        parent_str = h3.cell_to_parent(h3_str, parent_resolution)
-        return H3Utils._to_int(parent_str)
+        return h3.cell_to_parent(h3_index, parent_resolution)
 
     @staticmethod
-    def get_neighbor_h3s(h3_index: int, k: int = 1) -> Set[int]:
+    def get_neighbor_h3s(h3_index: int, k: int = 1) -> frozenset[int]:
         """
         Get neighboring H3 cells within k-ring distance
 
@@ -133,11 +165,9 @@ class H3Utils:
             k: Ring distance (1 = immediate neighbors, 2 = 2 rings, etc.)
 
         Returns:
-            Set[int]: Set of H3 indexes including center
+            frozenset[int]: Set of H3 indexes including center
         """
-        h3_str = h3.int_to_str(h3_index)
-        neighbors = h3.grid_disk(h3_str, k)
-        return {H3Utils._to_int(cell) for cell in neighbors}
+        return _grid_disk(h3_index, k)
 
     @staticmethod
     def get_h3_ring_for_radius(radius_km: float, resolution: int = 8) -> int:
@@ -159,11 +189,8 @@ class H3Utils:
     @staticmethod
     def get_lat_lng_from_h3(h3_index: int | str) -> Tuple[float, float]:
         if isinstance(h3_index, str):
-            h3_index = H3Utils._to_int(h3_index)
-            return h3.cell_to_latlng(h3_index)
-        else:
-            h3_str = h3.int_to_str(h3_index)
-            return h3.cell_to_latlng(h3_str)
+            h3_index = h3.str_to_int(h3_index)
+        return h3.cell_to_latlng(h3_index)
 
     @staticmethod
     def h3_to_string(h3_index: int) -> str:
@@ -171,7 +198,7 @@ class H3Utils:
 
     @staticmethod
     def string_to_h3(h3_string: str) -> int:
-        return H3Utils._to_int(h3.str_to_int(h3_string))
+        return h3.str_to_int(h3_string)
 
     @staticmethod
     def validate_coordinates_in_bounds(
@@ -182,7 +209,5 @@ class H3Utils:
         min_lng: float,
         max_lng: float,
     ) -> bool:
-        lat_val = float(lat)
-        lng_val = float(lng)
-
-        return min_lat <= lat_val <= max_lat and min_lng <= lng_val <= max_lng
+        # `Latitude` and `Longitude` are float subclasses, so they compare directly without coercion
+        return min_lat <= lat <= max_lat and min_lng <= lng <= max_lng
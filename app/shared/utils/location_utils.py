@@ -1,7 +1,18 @@
 import re
 import unicodedata
-from collections import Counter
 from difflib import SequenceMatcher
+from functools import lru_cache
+
+
+def _strip_marks(text: str) -> str:
+    nfd = unicodedata.normalize("NFD", text)
+    return "".join(char for char in nfd if unicodedata.category(char) != "Mn")
+
+
+# Accented Latin-1 and Latin Extended-A/B letters folded to their unaccented form
+_ACCENT_FOLD_TABLE = str.maketrans(
+    {char: folded for char in map(chr, range(0x80, 0x250)) if (folded := _strip_marks(char)) != char}
+)
 
 
 class LocationUtils:
@@ -17,6 +28,14 @@ class LocationUtils:
 
     SEPARATORS: set[str] = {",", "-", "/", "\\", "|", ";"}
 
+    _WS_RE = re.compile(r"\s+")
+    _QUOTE_RE = re.compile(r'["\']')
+    _TRIM_RE = re.compile(r"^[,\-\s]+|[,\-\s]+$")
+    # Location patterns and standalone numbers stripped in a single scan
+    _PATTERNS_RE = re.compile("|".join([*LOCATION_PATTERNS, r"\b\d+\b"]), re.IGNORECASE)
+    # Maps every separator to "," so a composite location splits with a single `split`
+    _SEP_TRANS = str.maketrans(dict.fromkeys(SEPARATORS, ","))
+
     def __init__(self, similarity_threshold: float = 0.85):
         """
         Initialize the normalizer.
@@ -30,6 +49,8 @@ class LocationUtils:
         """
         Normalize a location string to a canonical form.
 
+        Normalization only depends on the input string, so results are cached across instances.
+
         Args:
             location (str): Raw location string
 
@@ -39,23 +60,7 @@ class LocationUtils:
         if not location:
             return ""
 
-        normalized = location.lower().strip()
-
-        normalized = self._remove_accents(normalized)
-
-        normalized = re.sub(r"\s+", " ", normalized)
-
-        normalized = re.sub(r'["\']', "", normalized)
-
-        primary_location = self._extract_primary_location(normalized)
-
-        primary_location = self._remove_location_patterns(primary_location)
-
-        primary_location = re.sub(r"^[,\-\s]+|[,\-\s]+$", "", primary_location)
-
-        primary_location = primary_location.strip()
-
-        return primary_location
+        return _normalize_location(location)
 
     def similarity(self, loc1: str, loc2: str) -> float:
         """
@@ -74,19 +79,7 @@ class LocationUtils:
         if not norm1 or not norm2:
             return 0.0
 
-        base_similarity = SequenceMatcher(None, norm1, norm2).ratio()
-
-        if norm1 in norm2 or norm2 in norm1:
-            base_similarity = max(base_similarity, 0.9)
-
-        tokens1 = set(norm1.split())
-        tokens2 = set(norm2.split())
-
-        if tokens1 and tokens2:
-            token_overlap = len(tokens1 & tokens2) / min(len(tokens1), len(tokens2))
-            base_similarity = max(base_similarity, token_overlap * 0.95)
-
-        return base_similarity
+        return self._score(norm1, norm2, SequenceMatcher(None, norm1, norm2))
 
     def are_same_location(self, loc1: str, loc2: str) -> bool:
         """
@@ -115,38 +108,99 @@ class LocationUtils:
         if not locations:
             return "", []
 
-        normalized = [(loc, self.normalize(loc)) for loc in locations]
-
-        norm_counts = Counter(norm for _, norm in normalized)
-        canonical_normalized = norm_counts.most_common(1)[0][0]
+        # Group the originals by normalized form in a single pass
+        groups: dict[str, list[str]] = {}
+        for loc in locations:
+            groups.setdefault(self.normalize(loc), []).append(loc)
 
-        canonical_originals = [loc for loc, norm in normalized if norm == canonical_normalized]
-        canonical_form = max(canonical_originals, key=len) if canonical_originals else locations[0]
+        canonical_normalized = max(groups, key=lambda norm: len(groups[norm]))
+        canonical_form = max(groups[canonical_normalized], key=len)
 
         return canonical_form, locations
 
-    def _remove_accents(self, text: str) -> str:
-        nfd = unicodedata.normalize("NFD", text)
-        return "".join(char for char in nfd if unicodedata.category(char) != "Mn")
+    @staticmethod
+    def _score(norm1: str, norm2: str, matcher: SequenceMatcher) -> float:
+        """
+        Score two normalized, non-empty location strings.
+
+        The score is the best of the substring, token overlap and Ratcliff/Obershelp ratio scores. The ratio is
+        the expensive one, so it is only computed when its cheap upper bounds could beat the other two.
+
+        Args:
+            norm1 (str): First normalized location string
+            norm2 (str): Second normalized location string
+            matcher (SequenceMatcher): Matcher already set up with `norm1` and `norm2`
 
-    def _extract_primary_location(self, location: str) -> str:
+        Returns:
+            (float): Similarity score between 0 and 1
+        """
+        score = 0.9 if norm1 in norm2 or norm2 in norm1 else 0.0
+
+        tokens1 = set(norm1.split())
+        tokens2 = set(norm2.split())
+
+        if tokens1 and tokens2:
+            token_overlap = len(tokens1 & tokens2) / min(len(tokens1), len(tokens2))
+            score = max(score, token_overlap * 0.95)
+
+        if matcher.real_quick_ratio() > score and matcher.quick_ratio() > score:
+            score = max(score, matcher.ratio())
+
+        return score
+
+    @staticmethod
+    def _remove_accents(text: str) -> str:
+        if text.isascii():
+            return text
+
+        folded = text.translate(_ACCENT_FOLD_TABLE)
+        if folded.isascii():
+            return folded
+
+        # Scripts or combining marks outside the fold table
+        return _strip_marks(folded)
+
+    @classmethod
+    def _extract_primary_location(cls, location: str) -> str:
         """
         Extract the primary location from a composite location string.
         E.g., "Sangotedo, Ajah" -> "sangotedo"
         """
+        parts = location.translate(cls._SEP_TRANS).split(",")
+        return next((part.strip() for part in parts if part.strip()), location)
+
+    @classmethod
+    def _remove_location_patterns(cls, location: str) -> str:
+        return cls._PATTERNS_RE.sub("", location).strip()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_location(location: str) -> str:
+    """
+    Normalize a non-empty location string, see `LocationUtils.normalize`.
+
+    Args:
+        location (str): Raw location string
+
+    Returns:
+        str: Normalized location string
+    """
+    normalized = location.lower().strip()
+
+    normalized = LocationUtils._remove_accents(normalized)
+
+    normalized = LocationUtils._WS_RE.sub(" ", normalized)
+
+    normalized = LocationUtils._QUOTE_RE.sub("", normalized)
+
+    primary_location = LocationUtils._extract_primary_location(normalized)
 
-        for sep in self.SEPARATORS:
-            if sep in location:
-                parts = [p.strip() for p in location.split(sep) if p.strip()]
-                if parts:
-                    return parts[0]
+    primary_location = LocationUtils._remove_location_patterns(primary_location)
 
-        return location
+    primary_location = LocationUtils._TRIM_RE.sub("", primary_location)
 
-    def _remove_location_patterns(self, location: str) -> str:
-        for pattern in self.LOCATION_PATTERNS:
-            location = re.sub(pattern, "", location, flags=re.IGNORECASE)
+    return primary_location.strip()
 
-        location = re.sub(r"\b\d+\b", "", location)
 
-        return location.strip()
+# Shared instance with the default threshold, the precompiled normalization state lives on the class
+location_utils = LocationUtils()
@@ -1,5 +1,8 @@
 from typing import Any
 
+# Distinguishes a missing attribute from one set to None in a single `getattr`
+_MISSING = object()
+
 
 def get_obj_or_type_value(obj_or_type: Any, name: str, *args, **kwargs) -> Any | None:
     """
@@ -18,13 +21,12 @@ def get_obj_or_type_value(obj_or_type: Any, name: str, *args, **kwargs) -> Any |
     if isinstance(obj_or_type, dict):
         return obj_or_type.get(name, None)
 
-    if hasattr(obj_or_type, name):
-        obj = getattr(obj_or_type, name)
-        if callable(obj):
-            if args or kwargs:
-                return obj(*args, **kwargs)
-            return obj()
-        else:
-            return obj
-    else:
+    value = getattr(obj_or_type, name, _MISSING)
+
+    if value is _MISSING:
         return None
+
+    if callable(value):
+        return value(*args, **kwargs)
+
+    return value
@@ -1,14 +1,19 @@
+from functools import cache
 from typing import Any, Optional, Union, get_args, get_origin
 
 from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
 
 
+@cache
 def make_fields_optional(model_class: type[BaseModel]) -> type[BaseModel]:
     """
     Create a new Pydantic model with all fields made optional,
     except for fields that already have None as their default value.
 
+    The derived model is cached per input class, so building it again does not recompile its schema.
+
     Args:
         model_class: The original Pydantic BaseModel class
 
@@ -22,8 +27,6 @@ def make_fields_optional(model_class: type[BaseModel]) -> type[BaseModel]:
     for field_name, field_info in fields.items():
         original_annotation = field_info.annotation
 
-        from pydantic_core import PydanticUndefined
-
         has_default = field_info.default is not PydanticUndefined
         has_default_factory = field_info.default_factory is not None
 
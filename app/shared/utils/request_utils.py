@@ -1,3 +1,5 @@
+from collections.abc import Callable, Collection, Iterator, Mapping, Sequence
+from functools import lru_cache
 from typing import Literal
 
 from fastapi import Request
@@ -5,10 +7,45 @@ from shared.constants import PROXY_COUNT, PROXY_HEADERS
 from shared.types.schemas import RequestInfo
 
 
+class _LazyCookies(Mapping[str, str]):
+    """
+    Read-only view of the request cookies, parsed on first access.
+
+    The parsed cookies are kept on `request.state`, so every `Request` built for the same
+    ASGI scope (middlewares, dependencies, the handler) shares a single parse.
+    """
+
+    __slots__ = ("_request", "_cookies")
+
+    def __init__(self, request: Request) -> None:
+        self._request = request
+        self._cookies: dict[str, str] | None = None
+
+    def _parsed(self) -> dict[str, str]:
+        if self._cookies is None:
+            cookies: dict[str, str] | None = getattr(self._request.state, "cookies", None)
+
+            if cookies is None:
+                cookies = self._request.state.cookies = self._request.cookies
+
+            self._cookies = cookies
+
+        return self._cookies
+
+    def __getitem__(self, key: str) -> str:
+        return self._parsed()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parsed())
+
+    def __len__(self) -> int:
+        return len(self._parsed())
+
+
 def get_client_ip(
     request: Request,
     proxy_headers: list[str] | None = None,
-    trusted_proxies: list[str] | None = None,
+    trusted_proxies: Collection[str] | None = None,
     proxy_count: int | None = None,
 ) -> str | None:
     """
@@ -19,21 +56,31 @@ def get_client_ip(
     proxy_count = proxy_count or PROXY_COUNT
 
     for header_name in proxy_headers:
-        if header_name in request.headers:
-            header_value = request.headers[header_name]
-
-            if header_name == "X-Forwarded-For" and "," in header_value:
-                ips = [ip.strip() for ip in header_value.split(",")]
-
-                if trusted_proxies:
-                    if ips[-1] in trusted_proxies:
-                        idx = -1 - proxy_count
-                        if abs(idx) <= len(ips):
-                            return ips[idx]
-                else:
-                    return ips[0]
-            else:
-                return header_value
+        header_value = request.headers.get(header_name)
+
+        if header_value is None:
+            continue
+
+        if header_name != "X-Forwarded-For" or "," not in header_value:
+            return header_value
+
+        # Walk the comma boundaries with `find`/`rfind` and slice out the one address needed
+        if not trusted_proxies:
+            return header_value[: header_value.find(",")].strip()
+
+        start = header_value.rfind(",")
+        end = len(header_value)
+
+        if header_value[start + 1 :].strip() not in trusted_proxies:
+            continue
+
+        for _ in range(proxy_count):
+            if start == -1:
+                break
+            end = start
+            start = header_value.rfind(",", 0, end)
+        else:
+            return header_value[start + 1 : end].strip()
 
     if hasattr(request, "client") and request.client and hasattr(request.client, "host"):
         return request.client.host
@@ -45,22 +92,83 @@ def get_user_agent(request: Request) -> str:
     return request.headers.get("User-Agent", "Unknown")
 
 
+RequestInfoKey = Literal["user_agent", "ip_address", "request_id", "cookies", "authorization"]
+
+_ALL_REQUEST_INFO_KEYS: tuple[RequestInfoKey, ...] = (
+    "user_agent",
+    "ip_address",
+    "request_id",
+    "cookies",
+    "authorization",
+)
+
+
+def _extract_user_agent(request: Request, info: RequestInfo) -> None:
+    info.user_agent = get_user_agent(request)
+
+
+def _extract_request_id(request: Request, info: RequestInfo) -> None:
+    request_id: str | None = (
+        request.state.request_id if hasattr(request.state, "request_id") else request.headers.get("X-Request-ID")
+    )
+    info.request_id = request_id or "Unknown"
+
+
+def _extract_ip_address(request: Request, info: RequestInfo) -> None:
+    info.ip_address = get_client_ip(request) or "Unknown"
+
+
+def _extract_cookies(request: Request, info: RequestInfo) -> None:
+    info.cookies = _LazyCookies(request)
+
+
+def _extract_authorization(request: Request, info: RequestInfo) -> None:
+    auth_header = request.headers.get("Authorization")
+
+    if not auth_header:
+        info.authorization = None
+        return
+
+    parts = auth_header.split()
+    if len(parts) == 2 and parts[0].lower() == "bearer":
+        info.authorization = parts[1]
+    else:
+        info.authorization = auth_header
+
+
+_REQUEST_INFO_EXTRACTORS: dict[str, Callable[[Request, RequestInfo], None]] = {
+    "user_agent": _extract_user_agent,
+    "request_id": _extract_request_id,
+    "ip_address": _extract_ip_address,
+    "cookies": _extract_cookies,
+    "authorization": _extract_authorization,
+}
+
+
+@lru_cache(maxsize=32)
+def _request_info_extractors(keys: tuple[str, ...]) -> tuple[Callable[[Request, RequestInfo], None], ...]:
+    """
+    Resolve the extractors needed for a set of keys, call sites pass constant keys so this is cached.
+
+    Args:
+        keys (tuple[str, ...]): The requested keys, unsupported keys are ignored
+
+    Returns:
+        The extractors to run, one per supported key
+    """
+    return tuple(extractor for key, extractor in _REQUEST_INFO_EXTRACTORS.items() if key in keys)
+
+
 def get_request_info(
     request: Request,
-    keys: list[Literal["user_agent", "ip_address", "request_id", "cookies", "authorization"]] = [  # noqa: B006
-        "user_agent",
-        "ip_address",
-        "request_id",
-        "cookies",
-        "authorization",
-    ],
+    keys: Sequence[RequestInfoKey] = _ALL_REQUEST_INFO_KEYS,
 ) -> RequestInfo:
     """
     Extract specified information from the request object.
 
     Args:
         request (Request): The FastAPI request object.
-        keys (list[Literal["user_agent", "ip_address", "request_id", "cookies", "authorization"]]): List of keys to extract. Supported keys are 'user_agent', 'ip_address', 'request_id', 'cookies', and 'authorization'.
+        keys (Sequence[RequestInfoKey]): Keys to extract. Supported keys are 'user_agent', 'ip_address', 'request_id', 'cookies', and 'authorization'.
 
     Returns:
         RequestInfo: A RequestInfo object containing the extracted information.
@@ -68,32 +176,7 @@ def get_request_info(
 
     info = RequestInfo()
 
-    if "user_agent" in keys:
-        user_agent = get_user_agent(request)
-        info.user_agent = user_agent
-
-    if "request_id" in keys:
-        request_id: str | None = (
-            request.state.request_id if hasattr(request.state, "request_id") else request.headers.get("X-Request-ID")
-        )
-        info.request_id = request_id or "Unknown"
-
-    if "ip_address" in keys:
-        ip_address = get_client_ip(request)
-        info.ip_address = ip_address or "Unknown"
-
-    if "cookies" in keys:
-        info.cookies = dict(request.cookies) or {}
-
-    if "authorization" in keys:
-        auth_header = request.headers.get("Authorization")
-        if auth_header:
-            parts = auth_header.split()
-            if len(parts) == 2 and parts[0].lower() == "bearer":
-                info.authorization = parts[1]
-            else:
-                info.authorization = auth_header
-        else:
-            info.authorization = None
+    for extract in _request_info_extractors(tuple(keys)):
+        extract(request, info)
 
     return info
@@ -1,10 +1,31 @@
 import unicodedata
+from functools import lru_cache
+
+
+# Longer inputs are normalized without being cached so they cannot crowd out real location names
+_MAX_CACHED_LOCATION_LENGTH = 256
+
+
+def _strip_accents_lower(location: str) -> str:
+    # NFKD leaves ASCII untouched and ASCII has no combining characters
+    if location.isascii():
+        return location.lower()
+
+    nfkd = unicodedata.normalize("NFKD", location)
+    return "".join(c for c in nfkd if not unicodedata.combining(c)).lower()
+
+
+_strip_accents_lower_cached = lru_cache(maxsize=4096)(_strip_accents_lower)
 
 
 def normalize_location(location: str) -> str:
     """
     Normalize a location string by removing accents and converting to lowercase.
+
+    The same location names come up repeatedly, so results for short inputs are cached.
     """
 
-    normalized = unicodedata.normalize("NFKD", location)
-    return "".join(c for c in normalized if not unicodedata.combining(c)).lower()
+    if len(location) > _MAX_CACHED_LOCATION_LENGTH:
+        return _strip_accents_lower(location)
+
+    return _strip_accents_lower_cached(location)
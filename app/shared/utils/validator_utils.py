@@ -1,7 +1,22 @@
+import re
+import string
 from typing import Any, Optional
 
 from ulid import ULID
 
+_MISSING = object()
+
+# Commas together with the whitespace around them, so list pieces come out already stripped
+_LIST_SEPARATOR_RE = re.compile(r"\s*,\s*")
+
+# Crockford base32 alphabet of the canonical ULID representation; translating with these tables
+# leaves an empty string only when every character belongs to the alphabet
+_ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_ULID_DROP_TABLE = str.maketrans("", "", _ULID_ALPHABET)
+_HEX_DROP_TABLE = str.maketrans("", "", string.hexdigits)
+# A leading character above 7 overflows the 128-bit value
+_ULID_FIRST_CHARS = frozenset("01234567")
+
 
 def validate_bool(true_values: set[str] | None = None, false_values: set[str] | None = None):
     """
@@ -20,16 +35,18 @@ def validate_bool(true_values: set[str] | None = None, false_values: set[str] |
     if false_values is None:
         false_values = {"false", "0", "no", "off", "f", "n"}
 
+    # A value in both sets parses as True, as it did when `true_values` was checked first
+    table = dict.fromkeys(false_values, False) | dict.fromkeys(true_values, True)
+
     def parser(v: Any) -> bool:
+        # `bool` is a subclass of `int`, so it has to be checked first
         if isinstance(v, bool):
             return v
         if isinstance(v, str):
-            lower = v.lower().strip()
-            if lower in true_values:
-                return True
-            if lower in false_values:
-                return False
-            raise ValueError(f"Cannot parse '{v}' as boolean")
+            parsed = table.get(v.strip().lower(), _MISSING)
+            if parsed is _MISSING:
+                raise ValueError(f"Cannot parse '{v}' as boolean")
+            return parsed  # type: ignore[return-value]
         if isinstance(v, int):
             return bool(v)
         raise ValueError(f"Cannot convert {type(v)} to bool")
@@ -60,8 +77,8 @@ def validate_list[T](obj: Optional[T] | Any = None):
         elif isinstance(v, list):
             items = v
         else:
-            value = str(v)
-            items = value.split(",") if value != "" else []
+            # Split along with the list items below
+            items = [v]
 
         flattened: list[Any] = []
         for item in items:
@@ -70,11 +87,7 @@ def validate_list[T](obj: Optional[T] | Any = None):
             if isinstance(item, list):
                 flattened.extend(item)
             else:
-                pieces = str(item).split(",")
-                for p in pieces:
-                    piece = p.strip()
-                    if piece:
-                        flattened.append(piece)
+                flattened.extend(piece for piece in _LIST_SEPARATOR_RE.split(str(item).strip()) if piece)
 
         if obj and flattened:
             try:
@@ -100,14 +113,12 @@ def validate_string_to_ulid(value: str) -> str:
     Raises:
         ValueError: If the string is not a valid ULID.
     """
-    try:
-        if isinstance(value, str):
-            ULID.from_str(value)
+    if isinstance(value, str):
+        if len(value) == 26 and value[0] in _ULID_FIRST_CHARS and not value.translate(_ULID_DROP_TABLE):
             return value
-        elif isinstance(value, ULID):
-            return str(value)
-    except ValueError as e:
-        raise ValueError(f"Invalid ID passed: {value}") from e
+        raise ValueError(f"Invalid ID passed: {value}")
+    elif isinstance(value, ULID):
+        return str(value)
 
 
 def validate_hex_string_as_ulid(value: str) -> str:
@@ -121,6 +132,10 @@ def validate_hex_string_as_ulid(value: str) -> str:
         str: The hex string
 
     """
+    if isinstance(value, str) and len(value) == 32 and not value.translate(_HEX_DROP_TABLE):
+        return value
+
+    # Anything else is rare enough to leave to the full parser, which also accepts spaced-out hex
     try:
         ULID.from_hex(value)
         return value
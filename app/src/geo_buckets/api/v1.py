@@ -1,33 +1,61 @@
+import hashlib
 from typing import Annotated
 
 from database import get_db_session
-from fastapi import APIRouter, Depends, status
-from fastapi.encoders import jsonable_encoder
+from fastapi import APIRouter, Depends, Header, Response, status
 from shared.types import IResponse
-from shared.utils import build_json_response
 from sqlmodel.ext.asyncio.session import AsyncSession
 from src.geo_buckets.schemas.geo_bucket import GeoBucketStats
 from src.geo_buckets.services.geo_bucket_service import GeoBucketService
 
 router = APIRouter()
 
+GeoBucketStatsResponse = IResponse[GeoBucketStats, None]
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    return any(tag.strip() in (etag, "*") for tag in if_none_match.split(","))
+
 
 @router.get(
     "/stats",
     status_code=status.HTTP_200_OK,
     operation_id="get_geo_bucket_stats",
-    response_model=IResponse[GeoBucketStats, None],
+    response_model=GeoBucketStatsResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Statistics unchanged since the given ETag"}},
 )
-async def get_stats(session: Annotated[AsyncSession, Depends(get_db_session)]) -> IResponse[GeoBucketStats, None]:
+async def get_stats(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """
     Get the statistics of geo buckets.
+
+    Responses carry an ETag derived from their body, requests whose `If-None-Match` matches it get
+    an empty 304 response instead.
     """
 
     geo_bucket_service = GeoBucketService(session=session)
 
     data = await geo_bucket_service.get_stats()
 
-    return build_json_response(
-        data=jsonable_encoder(data),
-        message="Geo bucket statistics retrieved successfully.",
+    body = (
+        GeoBucketStatsResponse(
+            data=data,
+            message="Geo bucket statistics retrieved successfully.",
+        )
+        .model_dump_json()
+        .encode()
     )
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+    # Clients may keep the body but have to revalidate it, the statistics change with every property write
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
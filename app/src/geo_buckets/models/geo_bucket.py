@@ -45,6 +45,8 @@ class GeoBucket(
     )
 
     canonical_name: str = Field(sa_column=Column(TEXT(), nullable=True))
+    # Written from `LocationUtils.normalize`, the same form the fuzzy matching queries compare against, so it
+    # cannot be a generated `lower(unaccent(...))` column without changing which buckets match
     canonical_name_normalized: str = Field(sa_column=Column(TEXT(), nullable=True))
 
     center_point: str | None = Field(
@@ -57,4 +59,4 @@ class GeoBucket(
 
     property_count: int = Field(default=0, nullable=False)
 
-    properties: list["Property"] = Relationship(back_populates="geo_bucket")
+    properties: list["Property"] = Relationship(back_populates="geo_bucket", sa_relationship_kwargs={"lazy": "raise"})
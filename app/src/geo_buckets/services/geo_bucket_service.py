@@ -1,4 +1,3 @@
-import h3
 from core.logging import get_logger
 from geoalchemy2 import Geography
 from shared.exceptions import AppException, DatabaseException
@@ -74,7 +73,8 @@ class GeoBucketService:
 
             center_wkt, hexagon_wkt = self.h3_utils.h3_to_geometry(h3_index_r8)
 
-            bucket = await self.geo_bucket_repository.create(
+            # Another request may create the same bucket concurrently, the existing row is returned then
+            bucket = await self.geo_bucket_repository.create_if_not_exists(
                 schema={
                     "h3_index": h3_index_r8,
                     "h3_resolution": 8,
@@ -84,7 +84,8 @@ class GeoBucketService:
                     "hexagon_boundary": hexagon_wkt,
                     "parent_h3": parent_h3,
                     "property_count": 0,
-                }
+                },
+                unique_fields=["h3_index"],
             )
 
             return GeoBucketRead.from_model(bucket)
@@ -99,12 +100,13 @@ class GeoBucketService:
                 message="An unexpected error occurred while trying find the geobucket.",
             ) from exc
 
-    async def increment_property_count(self, geo_bucket_id: int) -> None:
+    async def increment_property_count(self, geo_bucket_id: int, count: int = 1) -> None:
         """
         Increment the property count for a given GeoBucket.
 
         Args:
             geo_bucket_id (int): The ID of the GeoBucket to update.
+            count (int): The number of properties added to the GeoBucket.
         """
         try:
             geo_bucket = await self.geo_bucket_repository.find_one_by_and_none(id=geo_bucket_id)
@@ -112,11 +114,11 @@ class GeoBucketService:
             if not geo_bucket:
                 raise AppException(message="GeoBucket not found for incrementing property count.")
 
-            geo_bucket.property_count += 1
+            geo_bucket.property_count += count
 
             self.session.add(geo_bucket)
 
-            await self.geo_bucket_repository.save_changes(geo_bucket)
+            await self.geo_bucket_repository.save_changes()
 
         except DatabaseException as db_exc:
             logger.error(f"DatabaseException in `increment_property_count`: {str(db_exc)}")
@@ -232,7 +234,7 @@ class GeoBucketService:
             if bucket.center_point:
                 lat, lng = self.h3_utils.extract_lat_lng_from_geometry(bucket.center_point)
             else:
-                lat, lng = h3.cell_to_latlng(bucket.h3_index)
+                lat, lng = self.h3_utils.get_lat_lng_from_h3(bucket.h3_index)
 
             result.append(
                 GeoBucketDistribution(
@@ -62,4 +62,6 @@ class Property(ULIDMixin, TimestampMixin, table=True):
     )
 
     geo_bucket_id: int | None = Field(default=None, foreign_key="geo_buckets.id", ondelete="SET NULL")
-    geo_bucket: Optional["GeoBucket"] = Relationship(back_populates="properties")
+    geo_bucket: Optional["GeoBucket"] = Relationship(
+        back_populates="properties", sa_relationship_kwargs={"lazy": "raise"}
+    )
@@ -1,16 +1,23 @@
+from collections.abc import Sequence
+
 from core.logging import get_logger
 from core.pagination import CursorPaginationMetadata, CursorParams
 from database import transactional
 from fastapi.exceptions import RequestValidationError
 from shared.exceptions import AppException, DatabaseException
-from shared.utils import H3Utils, LocationUtils
+from shared.utils import H3Utils, location_utils
 from sqlalchemy import func
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from src.geo_buckets.services.geo_bucket_service import GeoBucketService
 from src.properties.models.property import Property
 from src.properties.repositories.property_repository import PropertyRepository
-from src.properties.schemas.property import PropertyCreateRequest, PropertyQueryParams, PropertyRead
+from src.properties.schemas.property import (
+    PropertyCreate,
+    PropertyCreateRequest,
+    PropertyQueryParams,
+    PropertyRead,
+)
 
 logger = get_logger(__name__)
 
@@ -25,7 +32,7 @@ class PropertyService:
         self.property_repository = PropertyRepository(session=self.session)
         self.geo_bucket_service = GeoBucketService(session=self.session)
         self.h3_utils = H3Utils()
-        self.location_utils = LocationUtils()
+        self.location_utils = location_utils
 
     @transactional
     async def create_property(self, *, payload: PropertyCreateRequest):
@@ -132,6 +139,85 @@ class PropertyService:
             logger.error(f"Exception in `create_property`: {str(exc)}")
             raise AppException(message="An unexpected error occurred while creating the property listing.") from exc
 
+    @transactional
+    async def create_properties_if_not_exist(self, *, payloads: Sequence[PropertyCreateRequest]) -> list[PropertyRead]:
+        """
+        Create the properties whose title does not exist yet, in a single transaction.
+
+        Existing titles are looked up with one query and the new properties are inserted in one batch,
+        geo-bucket counts are incremented once per bucket.
+
+        Args:
+            payloads (Sequence[PropertyCreateRequest]): The property creation request data.
+
+        Returns:
+            list[PropertyRead]: The existing or created properties, in the order of `payloads`.
+        """
+        try:
+            existing_properties = await self.property_repository.find_all_in(
+                "title", [payload.title for payload in payloads]
+            )
+            properties_by_title = {property.title: property for property in existing_properties}
+
+            new_properties: list[PropertyCreate] = []
+            new_payloads: dict[str, PropertyCreateRequest] = {}
+            bucket_property_counts: dict[int, int] = {}
+
+            for payload in payloads:
+                if payload.title not in properties_by_title:
+                    new_payloads.setdefault(payload.title, payload)
+
+            # Index every new point in one batch rather than once per loop iteration
+            new_h3_indexes = self.h3_utils.calculate_h3_indexes_many(
+                (payload.lat, payload.lng) for payload in new_payloads.values()
+            )
+
+            for payload, h3_indexes in zip(new_payloads.values(), new_h3_indexes, strict=True):
+                normalized_name = self.location_utils.normalize(payload.location_name)
+
+                point_wkt = self.h3_utils.create_point_geometry(payload.lat, payload.lng)
+
+                bucket = await self.geo_bucket_service.find_or_create_bucket(
+                    h3_index_r8=h3_indexes.h3_r8,
+                    location_name=payload.location_name,
+                    normalized_name=normalized_name,
+                    parent_h3=h3_indexes.h3_r7,
+                )
+
+                new_properties.append(
+                    PropertyCreate(
+                        title=payload.title,
+                        location_name=payload.location_name,
+                        location_name_normalized=normalized_name,
+                        coordinates=point_wkt,
+                        h3_index_r8=h3_indexes.h3_r8,
+                        h3_index_r9=h3_indexes.h3_r9,
+                        geo_bucket_id=bucket.id,
+                        attributes=payload.attributes,
+                    )
+                )
+                bucket_property_counts[bucket.id] = bucket_property_counts.get(bucket.id, 0) + 1
+
+            if new_properties:
+                created_properties = await self.property_repository.create_many(new_properties)
+                properties_by_title.update((property.title, property) for property in created_properties)
+
+            for geo_bucket_id, count in bucket_property_counts.items():
+                await self.geo_bucket_service.increment_property_count(geo_bucket_id=geo_bucket_id, count=count)
+
+            return [
+                PropertyRead.from_values(model=properties_by_title[payload.title], h3=self.h3_utils)
+                for payload in payloads
+            ]
+        except DatabaseException as db_exc:
+            logger.error(f"DatabaseException in `create_properties_if_not_exist`: {str(db_exc)}")
+            raise AppException(message="Failed to create property listings.") from db_exc
+        except (AppException, RequestValidationError):
+            raise
+        except Exception as exc:
+            logger.error(f"Exception in `create_properties_if_not_exist`: {str(exc)}")
+            raise AppException(message="An unexpected error occurred while creating the property listings.") from exc
+
     async def list_properties(
         self, *, pagination: CursorParams, query_params: PropertyQueryParams | None
     ) -> tuple[list[PropertyRead], CursorPaginationMetadata]:
@@ -166,7 +252,7 @@ class PropertyService:
                 bucket_ids.update(b.id for b in fuzzy_buckets)
 
                 if not bucket_ids:
-                    return [], CursorPaginationMetadata(
+                    return [], CursorPaginationMetadata.model_construct(
                         total=0,
                         previous_page=None,
                         next_page=None,
@@ -183,6 +269,7 @@ class PropertyService:
             paginated_result = await self.property_repository.paginate(
                 query=base_query,
                 count_query=count_query,
+                include_total=True,
                 filters=None,
                 cursor_params=pagination,
                 transformer=transformer,
@@ -191,7 +278,13 @@ class PropertyService:
 
             data = [PropertyRead.model_validate(prop, from_attributes=True) for prop in paginated_result.items]
 
-            metadata = CursorPaginationMetadata.model_validate(paginated_result, from_attributes=True)
+            metadata = CursorPaginationMetadata.model_construct(
+                total=paginated_result.total,
+                current_page=paginated_result.current_page,
+                current_page_backwards=paginated_result.current_page_backwards,
+                previous_page=paginated_result.previous_page,
+                next_page=paginated_result.next_page,
+            )
 
             return data, metadata
         except DatabaseException as db_exc:
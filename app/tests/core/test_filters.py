@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from core.filters import Filter
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+from src.geo_buckets.models.geo_bucket import GeoBucket  # noqa: F401 - target of `Property.geo_bucket`
+from src.properties.models.property import Property
+
+
+class PropertyAttributesFilter(Filter):
+    attributes__jsonb_contains: str | None = None
+    attributes__jsonb_has_any_key: str | None = None
+    attributes__jsonb_has_all_keys: str | None = None
+
+    class Constants(Filter.Constants):
+        model = Property
+        default_order_by = "created_datetime"
+
+
+class FilterJSONBValuesTests(TestCase):
+    def _compile(self, filters: Filter):
+        return filters.filter(select(Property)).compile(dialect=postgresql.dialect())
+
+    def test_jsonb_contains__valid_json(self):
+        filters = PropertyAttributesFilter(attributes__jsonb_contains='{"bedrooms": 3}')
+
+        compiled = self._compile(filters)
+
+        self.assertIn("@>", str(compiled))
+        self.assertIn({"bedrooms": 3}, compiled.params.values())
+
+    def test_jsonb_contains__invalid_json(self):
+        with self.assertRaises(ValidationError) as context:
+            PropertyAttributesFilter(attributes__jsonb_contains="{bedrooms: 3")
+
+        self.assertIn("Invalid JSON for jsonb_contains", str(context.exception))
+
+    def test_jsonb_has_any_key__comma_split_keys(self):
+        filters = PropertyAttributesFilter(attributes__jsonb_has_any_key="pool,garden")
+
+        compiled = self._compile(filters)
+
+        self.assertIn("?|", str(compiled))
+        self.assertIn(["pool", "garden"], compiled.params.values())
+
+    def test_jsonb_has_all_keys__comma_split_keys(self):
+        filters = PropertyAttributesFilter(attributes__jsonb_has_all_keys="pool,garden")
+
+        compiled = self._compile(filters)
+
+        self.assertIn("?&", str(compiled))
+        self.assertIn(["pool", "garden"], compiled.params.values())
+
+    def test_jsonb_values__str_fields_keep_raw_values(self):
+        filters = PropertyAttributesFilter(
+            attributes__jsonb_contains='{"bedrooms": 3}',
+            attributes__jsonb_has_any_key="pool,garden",
+        )
+
+        self.assertEqual(filters.attributes__jsonb_contains, '{"bedrooms": 3}')
+        self.assertEqual(filters.attributes__jsonb_has_any_key, "pool,garden")
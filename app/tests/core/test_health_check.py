@@ -0,0 +1,77 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, patch
+
+from bootstrap import _deferred_init, create_app
+from core.middlewares.health_check import HealthCheckInterceptor
+from fastapi import status
+from fastapi.testclient import TestClient
+from shared.types import StartupState
+
+
+class HealthCheckProbeTests(TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.client = TestClient(HealthCheckInterceptor(self.app))
+
+    def test_probes__starting(self):
+        self.app.state.startup_state = StartupState.STARTING
+
+        live_response = self.client.get("/health/live")
+        ready_response = self.client.get("/health/ready")
+
+        self.assertEqual(live_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(live_response.json(), {"status": "alive"})
+        self.assertEqual(ready_response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(ready_response.json(), {"status": "starting"})
+
+    def test_probes__ready(self):
+        self.app.state.startup_state = StartupState.READY
+
+        live_response = self.client.get("/health/live")
+        ready_response = self.client.get("/health/ready")
+
+        self.assertEqual(live_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(ready_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(ready_response.json(), {"status": "ready"})
+
+    def test_probes__failed(self):
+        self.app.state.startup_state = StartupState.FAILED
+
+        live_response = self.client.get("/health/live")
+        ready_response = self.client.get("/health/ready")
+
+        self.assertEqual(live_response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(live_response.json(), {"status": "failed"})
+        self.assertEqual(ready_response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(ready_response.json(), {"status": "failed"})
+
+    def test_probes__before_lifespan(self):
+        response = self.client.get("/health/ready")
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.json(), {"status": "starting"})
+
+    def test_probes__method_not_allowed(self):
+        response = self.client.post("/health/ready")
+
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+        self.assertEqual(response.headers["allow"], "GET")
+
+
+class DeferredInitTests(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app.state.startup_state = StartupState.STARTING
+
+    async def test_deferred_init__ready(self):
+        with patch("core.initializers.seeds.run_seeds", new=AsyncMock()) as run_seeds:
+            await _deferred_init(self.app)
+
+        run_seeds.assert_awaited_once()
+        self.assertEqual(self.app.state.startup_state, StartupState.READY)
+
+    async def test_deferred_init__failed(self):
+        with patch("core.initializers.seeds.run_seeds", new=AsyncMock(side_effect=RuntimeError("Seeding failed"))):
+            await _deferred_init(self.app)
+
+        self.assertEqual(self.app.state.startup_state, StartupState.FAILED)
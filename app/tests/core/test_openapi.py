@@ -0,0 +1,59 @@
+import base64
+from unittest import TestCase
+from unittest.mock import patch
+
+from core.openapi.config import OpenAPI
+from core.openapi.middleware import OpenAPISecurityMiddleware
+from core.settings import settings
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from shared.errors import setup_exception_handler
+
+
+def _basic_auth(username: str, password: str) -> dict[str, str]:
+    credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+    return {"Authorization": f"Basic {credentials}"}
+
+
+class OpenAPISecurityTests(TestCase):
+    def setUp(self):
+        self.app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+        setup_exception_handler(self.app)
+
+        # The middleware raises authentication errors that the exception handlers render, the test client
+        # would re-raise them instead of returning the rendered response
+        self.client = TestClient(self.app, raise_server_exceptions=False)
+
+    def test_openapi__schema_requires_credentials(self):
+        # The documentation is only protected outside local environments, `APP_IS_LOCAL` is cached on the instance
+        with patch.dict(settings.__dict__, {"APP_IS_LOCAL": False}):
+            openapi = OpenAPI(docs_url="/docs", schema_path="/openapi.json")
+            openapi.setup(self.app)
+
+        unauthenticated_response = self.client.get("/docs/openapi.json")
+        authenticated_response = self.client.get(
+            "/docs/openapi.json",
+            headers=_basic_auth(settings.OPENAPI_USERNAME, settings.OPENAPI_PASSWORD),
+        )
+
+        self.assertEqual(unauthenticated_response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("Basic", unauthenticated_response.headers["www-authenticate"])
+        self.assertEqual(authenticated_response.status_code, status.HTTP_200_OK)
+
+    def test_openapi__password_containing_colon(self):
+        self.app.add_middleware(
+            OpenAPISecurityMiddleware,
+            username="Administrator",
+            password="pass:word:123",
+            paths=("/docs/openapi.json",),
+        )
+
+        @self.app.get("/docs/openapi.json")
+        async def schema():
+            return {}
+
+        valid_response = self.client.get("/docs/openapi.json", headers=_basic_auth("Administrator", "pass:word:123"))
+        truncated_response = self.client.get("/docs/openapi.json", headers=_basic_auth("Administrator", "pass"))
+
+        self.assertEqual(valid_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(truncated_response.status_code, status.HTTP_401_UNAUTHORIZED)
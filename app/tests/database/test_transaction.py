@@ -0,0 +1,72 @@
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+
+from database import transactional
+from database.transaction import Transaction, in_transaction
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class TransactionService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.depths: list[bool] = []
+
+    @transactional
+    async def outer(self, fail: bool = False) -> None:
+        self.depths.append(in_transaction(self.session))
+        await self.inner(fail=fail)
+
+    @transactional
+    async def inner(self, fail: bool = False) -> None:
+        self.depths.append(in_transaction(self.session))
+
+        if fail:
+            raise RuntimeError("Inner operation failed")
+
+
+class NestedTransactionTests(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.session = AsyncMock(spec=AsyncSession)
+        self.session.info = {}
+
+    async def test_transaction__nested_commits_once(self):
+        async with Transaction(self.session):
+            async with Transaction(self.session):
+                self.assertTrue(in_transaction(self.session))
+                self.assertEqual(self.session.info["tx_depth"], 2)
+
+            self.session.commit.assert_not_awaited()
+
+        self.session.commit.assert_awaited_once()
+        self.session.rollback.assert_not_awaited()
+        self.assertFalse(in_transaction(self.session))
+
+    async def test_transaction__nested_rollback(self):
+        with self.assertRaises(RuntimeError):
+            async with Transaction(self.session):
+                async with Transaction(self.session):
+                    raise RuntimeError("Inner operation failed")
+
+        self.session.rollback.assert_awaited_once()
+        self.session.commit.assert_not_awaited()
+        self.assertFalse(in_transaction(self.session))
+
+    async def test_transactional__nested_commits_once(self):
+        service = TransactionService(session=self.session)
+
+        await service.outer()
+
+        self.assertEqual(service.depths, [True, True])
+        self.session.commit.assert_awaited_once()
+        self.session.rollback.assert_not_awaited()
+        self.assertFalse(in_transaction(self.session))
+
+    async def test_transactional__nested_rollback(self):
+        service = TransactionService(session=self.session)
+
+        with self.assertRaises(RuntimeError):
+            await service.outer(fail=True)
+
+        self.session.rollback.assert_awaited_once()
+        self.session.commit.assert_not_awaited()
+        self.assertFalse(in_transaction(self.session))
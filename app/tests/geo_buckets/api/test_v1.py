@@ -201,3 +201,30 @@ class GetGeoBucketStatsRouterTests(CustomDBTestCase):
 
         self.assertEqual(data1["total_buckets"], data2["total_buckets"])
         self.assertEqual(data1["empty_buckets"], data2["empty_buckets"])
+
+    def test_get_stats__etag_header(self):
+        response = self.client.get(url=self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.headers["etag"].startswith('W/"'))
+        self.assertEqual(response.headers["cache-control"], "no-cache")
+
+    def test_get_stats__not_modified_for_matching_etag(self):
+        etag = self.client.get(url=self.url).headers["etag"]
+
+        response = self.client.get(url=self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.headers["etag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_get_stats__stale_etag_after_changes(self):
+        etag = self.client.get(url=self.url).headers["etag"]
+
+        GeoBucketFactory.create(property_count=0)
+
+        response = self.client.get(url=self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers["etag"], etag)
+        self.assertGreaterEqual(response.json()["data"]["empty_buckets"], 4)
@@ -0,0 +1,54 @@
+from shared.exceptions import DatabaseException
+from shared.utils import H3Utils
+from sqlmodel import select
+from src.geo_buckets.models.geo_bucket import GeoBucket
+from src.geo_buckets.repositories.geo_bucket_repository import GeoBucketRepository
+from tests.geo_buckets.factory import GeoBucketFactory
+from tests.testutils import AsyncCustomDBTestCase
+
+
+class CreateIfNotExistsTests(AsyncCustomDBTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.h3_indexes = H3Utils.calculate_h3_indexes(6.5244, 3.3792)
+        self.schema = {
+            "h3_index": self.h3_indexes.h3_r8,
+            "h3_resolution": 8,
+            "parent_h3": self.h3_indexes.h3_r7,
+            "canonical_name": "Lagos",
+            "canonical_name_normalized": "lagos",
+            "property_count": 0,
+        }
+
+    async def test_create_if_not_exists__inserts_new_record(self):
+        repository = GeoBucketRepository(session=self.async_db_session)
+
+        bucket = await repository.create_if_not_exists(self.schema, unique_fields=["h3_index"])
+
+        self.assertIsNotNone(bucket.id)
+        self.assertEqual(bucket.h3_index, self.h3_indexes.h3_r8)
+        self.assertEqual(bucket.canonical_name, "Lagos")
+
+    async def test_create_if_not_exists__returns_existing_record_on_conflict(self):
+        existing_bucket = GeoBucketFactory.create(h3_index=self.h3_indexes.h3_r8, canonical_name="Lagos Island")
+        repository = GeoBucketRepository(session=self.async_db_session)
+
+        bucket = await repository.create_if_not_exists(self.schema, unique_fields=["h3_index"])
+
+        self.assertEqual(bucket.id, existing_bucket.id)
+        self.assertEqual(bucket.canonical_name, "Lagos Island")
+        buckets = self.session.exec(select(GeoBucket).where(GeoBucket.h3_index == self.h3_indexes.h3_r8)).all()
+        self.assertEqual(len(buckets), 1)
+
+    async def test_create_if_not_exists__empty_unique_fields(self):
+        repository = GeoBucketRepository(session=self.async_db_session)
+
+        with self.assertRaises(DatabaseException):
+            await repository.create_if_not_exists(self.schema, unique_fields=[])
+
+    async def test_create_if_not_exists__unknown_unique_fields(self):
+        repository = GeoBucketRepository(session=self.async_db_session)
+
+        with self.assertRaises(DatabaseException):
+            await repository.create_if_not_exists(self.schema, unique_fields=["h3_index", "not_a_column"])
@@ -165,6 +165,71 @@ class CreatePropertyIfNotExistsTests(AsyncCustomDBTestCase):
         self.assertEqual(property_read.title, existing_property.title)
 
 
+class CreatePropertiesIfNotExistTests(AsyncCustomDBTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.h3_utils = H3Utils()
+        self.location_utils = LocationUtils()
+
+        self.lat = 6.5244
+        self.lng = 3.3792
+        self.location_name = "Lagos"
+
+        self.geo_bucket = GeoBucketFactory.create(
+            canonical_name=self.location_name,
+            canonical_name_normalized=self.location_utils.normalize(self.location_name),
+        )
+
+    async def test_create_properties_if_not_exist__new_and_existing_properties(self):
+        """Test that only missing properties are created and results follow the payload order."""
+        existing_property = PropertyFactory.create(
+            title="Existing property",
+            geo_bucket=self.geo_bucket,
+        )
+
+        payloads = [
+            PropertyCreateRequest(
+                title=title,
+                location_name=self.location_name,
+                lat=Latitude(self.lat),
+                lng=Longitude(self.lng),
+                attributes={},
+            )
+            for title in ["New property", "Existing property", "Another new property"]
+        ]
+
+        service = PropertyService(session=self.async_db_session)
+        properties_read = await service.create_properties_if_not_exist(payloads=payloads)
+
+        self.assertEqual(
+            [property_read.title for property_read in properties_read],
+            ["New property", "Existing property", "Another new property"],
+        )
+        self.assertEqual(properties_read[1].id, existing_property.id)
+
+    async def test_create_properties_if_not_exist__database_exception(self):
+        payload = PropertyCreateRequest(
+            title="Failing property",
+            location_name=self.location_name,
+            lat=Latitude(self.lat),
+            lng=Longitude(self.lng),
+            attributes={},
+        )
+
+        service = PropertyService(session=self.async_db_session)
+
+        with patch.object(
+            service.property_repository,
+            "find_all_in",
+            side_effect=DatabaseException("Database error"),
+        ):
+            with self.assertRaises(AppException) as context:
+                await service.create_properties_if_not_exist(payloads=[payload])
+
+            self.assertIn("Failed to create property listings", str(context.exception))
+
+
 class ListPropertiesTests(AsyncCustomDBTestCase):
     def setUp(self):
         super().setUp()